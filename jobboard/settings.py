@@ -137,6 +137,36 @@ else:
     }
 
 
+# Caches
+# Default in-process cache, plus an on-disk cache for external search API
+# responses so importer re-runs don't spend the Google CSE daily quota again.
+# "listings" holds filtered job-listing ids; it must be shared by the web
+# workers and the import cron so job saves invalidate every process.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "listings": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("LISTINGS_CACHE_DIR", "/tmp/listings_cache"),
+        "TIMEOUT": 60 * 5,  # 5 minutes
+    },
+    "search": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("SEARCH_CACHE_DIR", "/tmp/cse_cache"),
+        "TIMEOUT": 60 * 60,  # 1 hour
+    },
+    "llm": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("LLM_CACHE_DIR", "/tmp/llm_parse_cache"),
+        "TIMEOUT": 60 * 60 * 24 * 7,  # 7 days
+        # One entry per parsed job; the default of 300 would cull a third of
+        # the cache on nearly every write during an import
+        "OPTIONS": {"MAX_ENTRIES": 50000},
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -50,9 +50,9 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             "--backend",
-            choices=["auto", "google_cse", "duckduckgo", "serper", "googlesearch"],
+            choices=["auto", "google_cse", "duckduckgo", "serper", "googlesearch", "all"],
             default="auto",
-            help="Search backend: 'google_cse' (100/day, recommended), 'duckduckgo' (free), 'serper', 'auto' (default).",
+            help="Search backend: 'google_cse' (100/day, recommended), 'duckduckgo' (free), 'serper', 'all' (every configured backend in parallel), 'auto' (default).",
         )
         parser.add_argument(
             "--no-date-binning",
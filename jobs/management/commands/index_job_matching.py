@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job
+from jobs.services.matching_service import MatchingService
+
+
+class Command(BaseCommand):
+    help = 'Populate search_keywords/extracted_skill_slugs for all active jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true',
+                            help='Update all jobs, not just those without stored keywords')
+
+    def handle(self, *args, **options):
+        qs = Job.objects.filter(is_active=True)
+        if not options['force']:
+            qs = qs.filter(search_keywords__isnull=True)
+        qs = qs.only('id', 'title', 'description', 'requirements')
+
+        total = qs.count()
+        if total == 0:
+            self.stdout.write('No jobs need updating.')
+            return
+
+        self.stdout.write(f'Indexing matching terms for {total} jobs...')
+
+        batch = []
+        for job in qs.iterator(chunk_size=500):
+            job.search_keywords, job.extracted_skill_slugs = MatchingService.build_job_index(job)
+            batch.append(job)
+            if len(batch) >= 500:
+                Job.objects.bulk_update(batch, ['search_keywords', 'extracted_skill_slugs'])
+                batch = []
+        if batch:
+            Job.objects.bulk_update(batch, ['search_keywords', 'extracted_skill_slugs'])
+
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} jobs'))
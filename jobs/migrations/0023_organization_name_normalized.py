@@ -0,0 +1,23 @@
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+def populate_name_normalized(apps, schema_editor):
+    Organization = apps.get_model('jobs', 'Organization')
+    Organization.objects.update(name_normalized=Lower(Trim('name')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0022_add_org_impact_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='name_normalized',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(populate_name_normalized, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0023_organization_name_normalized'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_keywords',
+            field=models.JSONField(blank=True, editable=False, help_text='Keywords MatchingService extracts from the job text', null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='extracted_skill_slugs',
+            field=models.JSONField(blank=True, editable=False, help_text='Skill slugs MatchingService finds in the job text', null=True),
+        ),
+    ]
@@ -19,6 +19,10 @@ class Organization(models.Model):
         REJECTED = "rejected", "Rejected"
 
     name = models.CharField(max_length=255)
+    # Case/whitespace-folded name for indexed lookups; maintained in save()
+    name_normalized = models.CharField(
+        max_length=255, db_index=True, blank=True, editable=False
+    )
     slug = models.SlugField(max_length=255, unique=True)
     description = models.TextField(
         blank=True, help_text="Brief description of the organization"
@@ -118,6 +122,17 @@ class Organization(models.Model):
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        return (name or "").strip().lower()
+
+    def save(self, *args, **kwargs):
+        self.name_normalized = self.normalize_name(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "name_normalized"}
+        super().save(*args, **kwargs)
+
     @property
     def impact_profile_completeness(self) -> int:
         """Calculate profile completeness percentage (0-100)."""
@@ -276,6 +291,16 @@ class Job(models.Model):
     skills = models.JSONField(
         default=list, blank=True, help_text="AI-extracted skill slugs from job"
     )
+    # Derived from title/description/requirements by the index_job_matching
+    # command; cleared when the text changes (see signals)
+    search_keywords = models.JSONField(
+        null=True, blank=True, editable=False,
+        help_text="Keywords MatchingService extracts from the job text",
+    )
+    extracted_skill_slugs = models.JSONField(
+        null=True, blank=True, editable=False,
+        help_text="Skill slugs MatchingService finds in the job text",
+    )
 
     source = models.CharField(
         max_length=50, choices=Source.choices, default=Source.MANUAL
@@ -327,6 +352,28 @@ class Job(models.Model):
             )
         ]
 
+    # Text columns indexed by search_vector (see jobs.signals)
+    SEARCH_TEXT_FIELDS = ("title", "description", "requirements", "impact")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the indexed text as loaded so a later save can tell
+        # whether search_vector needs rebuilding
+        if all(f in field_names for f in cls.SEARCH_TEXT_FIELDS):
+            instance.remember_search_text()
+        return instance
+
+    def remember_search_text(self):
+        self._loaded_search_text = tuple(getattr(self, f) for f in self.SEARCH_TEXT_FIELDS)
+
+    def search_text_changed(self) -> bool:
+        """True unless the indexed text is known to match what was loaded."""
+        loaded = getattr(self, "_loaded_search_text", None)
+        return loaded is None or loaded != tuple(
+            getattr(self, f) for f in self.SEARCH_TEXT_FIELDS
+        )
+
     def __str__(self):
         return f"{self.title} at {self.organization.name}"
 
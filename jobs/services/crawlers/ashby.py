@@ -5,6 +5,7 @@ API: https://api.ashbyhq.com/posting-api/job-board/{company}
 """
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Optional
@@ -21,6 +22,7 @@ logger = logging.getLogger(__name__)
 ASHBY_API_BASE = "https://api.ashbyhq.com/posting-api/job-board"
 
 
+@functools.lru_cache(maxsize=2048)
 def extract_ashby_info(url: str) -> tuple[Optional[str], Optional[str]]:
     """
     Extract company and job_id from Ashby URL.
@@ -5,6 +5,7 @@ API: https://boards-api.greenhouse.io/v1/boards/{company}/jobs/{job_id}
 """
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Optional
@@ -21,6 +22,7 @@ logger = logging.getLogger(__name__)
 GREENHOUSE_API_BASE = "https://boards-api.greenhouse.io/v1/boards"
 
 
+@functools.lru_cache(maxsize=2048)
 def extract_greenhouse_info(url: str) -> tuple[Optional[str], Optional[str]]:
     """
     Extract company and job_id from Greenhouse URL.
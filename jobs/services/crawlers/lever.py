@@ -5,6 +5,7 @@ API: https://api.lever.co/v0/postings/{company}?mode=json
 """
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from datetime import datetime, timezone
@@ -22,6 +23,7 @@ logger = logging.getLogger(__name__)
 LEVER_API_BASE = "https://api.lever.co/v0/postings"
 
 
+@functools.lru_cache(maxsize=2048)
 def extract_lever_info(url: str) -> tuple[Optional[str], Optional[str]]:
     """
     Extract company and job_id from Lever URL.
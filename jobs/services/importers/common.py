@@ -4,7 +4,7 @@ import asyncio
 import logging
 from copy import deepcopy
 from datetime import datetime, timezone as dt_timezone
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 import requests
 from asgiref.sync import sync_to_async
@@ -22,6 +22,49 @@ logger = logging.getLogger(__name__)
 _IMPACT_AREA_BY_SLUG = {area["slug"]: area for area in IMPACT_AREAS}
 
 
+class JobPayload(NamedTuple):
+    """
+    Compact job payload for importers that build many identical-shape records.
+
+    Same keys as the payload dicts; converted with _payload_dict() before saving.
+    Fields left as None fall back to the defaults in _upsert_job.
+    """
+
+    source: str
+    external_id: str
+    title: str
+    organization_name: str
+    description: str = ""
+    requirements: str = ""
+    location: str = "Remote"
+    job_type: str = "full-time"
+    application_url: str = ""
+    application_email: str = ""
+    organization_url: str = ""
+    organization_description: str = ""
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    salary_currency: Optional[str] = None
+    posted_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    category_name: Optional[str] = None
+    is_featured: bool = False
+    raw_data: Optional[Dict] = None
+
+
+def _payload_dict(payload: Union[Dict, JobPayload]) -> Dict:
+    """Return the dict form of a payload, dropping unset JobPayload fields."""
+    if isinstance(payload, JobPayload):
+        return {k: v for k, v in payload._asdict().items() if v is not None}
+    return payload
+
+
+def _payload_value(payload: Union[Dict, JobPayload], key: str) -> Any:
+    if isinstance(payload, JobPayload):
+        return getattr(payload, key) or ""
+    return payload.get(key, "")
+
+
 async def _async_return(value):
     """Simple async wrapper that returns a value unchanged."""
     return value
@@ -172,25 +215,95 @@ def _ensure_job_slug(title: str, organization_name: str) -> str:
     return unique_slug(Job, f"{title}-{organization_name}")
 
 
-def _upsert_job(payload: Dict) -> Tuple[Job, bool]:
-    """
-    Persist a job dict returning (job, created?).
-    Expected payload keys: see individual importers.
+def _category_key(payload: Dict) -> Tuple[str, str]:
+    """Key identifying the category a payload resolves to."""
+    return (payload.get("category_slug") or "", payload.get("category_name") or "")
 
-    Note: AI processing should be done via batch_upsert_jobs() before calling this.
-    """
-    organization = _get_or_create_org(
-        payload["organization_name"],
-        website=payload.get("organization_url", ""),
-        description=payload.get("organization_description", ""),
-    )
 
+def _resolve_category(payload: Dict) -> Optional[Category]:
     # Prefer category_slug from AI parsing, fall back to category_name
     category = None
     if payload.get("category_slug"):
         category = _get_or_create_category_by_slug(payload["category_slug"])
     if not category and payload.get("category_name"):
         category = _get_or_create_category(payload["category_name"])
+    return category
+
+
+def _bulk_resolve_orgs(payloads: Iterable[Dict]) -> Dict[str, int]:
+    """
+    Resolve each distinct organization in a batch once.
+
+    Returns a {organization_name: pk} map so jobs can be built from integer
+    FKs instead of holding Organization instances for the whole batch.
+    """
+    org_ids: Dict[str, int] = {}
+    for payload in payloads:
+        name = payload.get("organization_name") or "Unknown Organization"
+        if name in org_ids:
+            continue
+        org = _get_or_create_org(
+            name,
+            website=payload.get("organization_url", ""),
+            description=payload.get("organization_description", ""),
+        )
+        org_ids[name] = org.pk
+    return org_ids
+
+
+def _bulk_resolve_categories(
+    payloads: Iterable[Dict],
+) -> Dict[Tuple[str, str], Optional[int]]:
+    """Resolve each distinct category in a batch once, returning {key: pk}."""
+    category_ids: Dict[Tuple[str, str], Optional[int]] = {}
+    for payload in payloads:
+        key = _category_key(payload)
+        if key in category_ids:
+            continue
+        category = _resolve_category(payload)
+        category_ids[key] = category.pk if category else None
+    return category_ids
+
+
+def _bulk_resolve_fks_sync(
+    payloads: List[Dict],
+) -> Tuple[Dict[str, int], Dict[Tuple[str, str], Optional[int]]]:
+    """Synchronous wrapper resolving org and category FKs for a batch."""
+    close_old_connections()
+    with transaction.atomic():
+        return _bulk_resolve_orgs(payloads), _bulk_resolve_categories(payloads)
+
+
+def _upsert_job(
+    payload: Dict,
+    org_ids: Optional[Dict[str, int]] = None,
+    category_ids: Optional[Dict[Tuple[str, str], Optional[int]]] = None,
+) -> Tuple[Job, bool]:
+    """
+    Persist a job dict returning (job, created?).
+    Expected payload keys: see individual importers.
+
+    org_ids / category_ids are the maps from _bulk_resolve_orgs and
+    _bulk_resolve_categories; when omitted, FKs are resolved per job.
+
+    Note: AI processing should be done via batch_upsert_jobs() before calling this.
+    """
+    organization_name = payload["organization_name"] or "Unknown Organization"
+    if org_ids is not None and organization_name in org_ids:
+        organization_id = org_ids[organization_name]
+    else:
+        organization_id = _get_or_create_org(
+            organization_name,
+            website=payload.get("organization_url", ""),
+            description=payload.get("organization_description", ""),
+        ).pk
+
+    key = _category_key(payload)
+    if category_ids is not None and key in category_ids:
+        category_id = category_ids[key]
+    else:
+        category = _resolve_category(payload)
+        category_id = category.pk if category else None
 
     # Normalize location to standard country/region value
     raw_location = payload.get("location", "Remote")
@@ -228,16 +341,16 @@ def _upsert_job(payload: Dict) -> Tuple[Job, bool]:
     if job:
         for field, value in defaults.items():
             setattr(job, field, value)
-        job.organization = organization
-        job.category = category
+        job.organization_id = organization_id
+        job.category_id = category_id
         job.save()
         return job, False
 
-    slug = _ensure_job_slug(payload["title"], organization.name)
+    slug = _ensure_job_slug(payload["title"], organization_name)
     job = Job(
         slug=slug,
-        organization=organization,
-        category=category,
+        organization_id=organization_id,
+        category_id=category_id,
         source=payload["source"],
         external_id=payload["external_id"],
         **defaults,
@@ -246,16 +359,20 @@ def _upsert_job(payload: Dict) -> Tuple[Job, bool]:
     return job, True
 
 
-def _upsert_job_sync(payload: Dict) -> Tuple[Job, bool]:
+def _upsert_job_sync(
+    payload: Dict,
+    org_ids: Optional[Dict[str, int]] = None,
+    category_ids: Optional[Dict[Tuple[str, str], Optional[int]]] = None,
+) -> Tuple[Job, bool]:
     """Synchronous wrapper for _upsert_job with transaction."""
     # Reset stale connections before database write (important for long-running async imports)
     close_old_connections()
     with transaction.atomic():
-        return _upsert_job(payload)
+        return _upsert_job(payload, org_ids, category_ids)
 
 
 async def batch_upsert_jobs(
-    payloads: List[Dict],
+    payloads: List[Union[Dict, JobPayload]],
     use_ai: bool = False,
     batch_size: int = 50,
     progress_callback: Optional[Callable[[int, int], None]] = None,
@@ -269,7 +386,7 @@ async def batch_upsert_jobs(
     Processes and saves jobs in batches for better performance and incremental saving.
 
     Args:
-        payloads: List of job payload dicts from importers
+        payloads: List of job payload dicts (or JobPayload tuples) from importers
         use_ai: Whether to use AI to enrich job descriptions
         batch_size: Number of jobs per batch (default: 50)
         progress_callback: Optional callback(completed, total) for progress updates
@@ -290,8 +407,8 @@ async def batch_upsert_jobs(
         check_exists = sync_to_async(job_exists_in_source, thread_sensitive=True)
         filtered_payloads = []
         for payload in payloads:
-            source = payload.get("source", "")
-            external_id = payload.get("external_id", "")
+            source = _payload_value(payload, "source")
+            external_id = _payload_value(payload, "external_id")
             if source and external_id and await check_exists(source, external_id):
                 stats["skipped"] += 1
             else:
@@ -305,8 +422,8 @@ async def batch_upsert_jobs(
         check_duplicate = sync_to_async(is_duplicate_job, thread_sensitive=True)
         filtered_payloads = []
         for payload in payloads:
-            app_url = payload.get("application_url", "")
-            source = payload.get("source", "")
+            app_url = _payload_value(payload, "application_url")
+            source = _payload_value(payload, "source")
             if app_url and await check_duplicate(app_url, source):
                 stats["skipped"] += 1
                 logger.debug(f"Skipping duplicate URL: {app_url[:50]}...")
@@ -322,6 +439,7 @@ async def batch_upsert_jobs(
     total = len(payloads)
     completed = 0
     upsert_async = sync_to_async(_upsert_job_sync, thread_sensitive=True)
+    resolve_fks_async = sync_to_async(_bulk_resolve_fks_sync, thread_sensitive=True)
 
     # Initialize parser once if using AI
     parser = None
@@ -335,54 +453,69 @@ async def batch_upsert_jobs(
             logger.error(f"Failed to initialize AI parser: {e}")
             use_ai = False
 
-    # Process in batches - AI parse and save each batch immediately
-    for batch_start in range(0, total, batch_size):
-        batch_end = min(batch_start + batch_size, total)
-        batch = payloads[batch_start:batch_end]
-
-        # AI process this batch if enabled
-        if use_ai and parser:
+    # The parser's connection pool lives for this import only
+    try:
+        # Process in batches - AI parse and save each batch immediately
+        for batch_start in range(0, total, batch_size):
+            batch_end = min(batch_start + batch_size, total)
+            batch = [_payload_dict(p) for p in payloads[batch_start:batch_end]]
+            original_batch = batch
+
+            # AI process this batch if enabled
+            if use_ai and parser:
+                try:
+                    # Process batch with high concurrency
+                    tasks = []
+                    for payload in batch:
+                        title = payload.get("title", "Untitled")
+                        org = payload.get("organization_name", "Unknown")
+                        desc = payload.get("description", "")
+                        if len(desc) >= 50:
+                            tasks.append(parser._parse_and_enrich(payload, title, org, desc))
+                        else:
+                            tasks.append(_async_return(payload))
+
+                    # Run all AI calls in parallel
+                    batch = await asyncio.gather(*tasks, return_exceptions=True)
+                    batch = [b if not isinstance(b, Exception) else original_batch[i]
+                            for i, b in enumerate(batch)]
+                except Exception as e:
+                    logger.error(f"AI batch processing failed: {e}")
+                    # Continue with original batch
+
+            # Resolve org/category FKs once per batch, then save with integer IDs
             try:
-                # Process batch with high concurrency
-                tasks = []
-                for payload in batch:
-                    title = payload.get("title", "Untitled")
-                    org = payload.get("organization_name", "Unknown")
-                    desc = payload.get("description", "")
-                    if len(desc) >= 50:
-                        tasks.append(parser._parse_and_enrich(payload, title, org, desc))
-                    else:
-                        tasks.append(_async_return(payload))
-
-                # Run all AI calls in parallel
-                batch = await asyncio.gather(*tasks, return_exceptions=True)
-                batch = [b if not isinstance(b, Exception) else payloads[batch_start + i]
-                        for i, b in enumerate(batch)]
+                org_ids, category_ids = await resolve_fks_async(batch)
             except Exception as e:
-                logger.error(f"AI batch processing failed: {e}")
-                # Continue with original batch
+                logger.error(f"Failed to resolve organizations/categories: {e}")
+                org_ids, category_ids = None, None
 
-        # Save this batch to database immediately
-        save_tasks = [upsert_async(payload) for payload in batch]
-        results = await asyncio.gather(*save_tasks, return_exceptions=True)
+            # Save this batch to database immediately
+            save_tasks = [
+                upsert_async(payload, org_ids, category_ids) for payload in batch
+            ]
+            results = await asyncio.gather(*save_tasks, return_exceptions=True)
 
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to save job: {result}")
-            else:
-                job, created = result
-                if created:
-                    stats["created"] += 1
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to save job: {result}")
                 else:
-                    stats["updated"] += 1
+                    job, created = result
+                    if created:
+                        stats["created"] += 1
+                    else:
+                        stats["updated"] += 1
 
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, total)
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total)
 
-        # Brief delay between batches to avoid overwhelming the system
-        if batch_end < total:
-            await asyncio.sleep(0.1)
+            # Brief delay between batches to avoid overwhelming the system
+            if batch_end < total:
+                await asyncio.sleep(0.1)
+    finally:
+        if parser:
+            await parser.aclose()
 
     logger.info(f"Import complete: {stats['created']} created, {stats['updated']} updated")
     return stats
@@ -419,40 +552,43 @@ async def batch_process_with_ai(
         logger.warning("No AI parser available, returning original payloads")
         return payloads
 
-    enriched = []
-    total = len(payloads)
-
-    for batch_start in range(0, total, batch_size):
-        batch_end = min(batch_start + batch_size, total)
-        batch = payloads[batch_start:batch_end]
-
-        tasks = []
-        for payload in batch:
-            title = payload.get("title", "Untitled")
-            org = payload.get("organization_name", "Unknown")
-            desc = payload.get("description", "")
-
-            if len(desc) >= 50:
-                # Create a modified payload for AI processing
-                ai_payload = {**payload}
-                tasks.append(_enrich_single_job(parser, ai_payload, title, org, desc))
-            else:
-                tasks.append(_async_return(payload))
-
-        # Run all AI calls in parallel
-        try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"AI enrichment failed: {result}")
-                    enriched.append(batch[i])
+    try:
+        enriched = []
+        total = len(payloads)
+
+        for batch_start in range(0, total, batch_size):
+            batch_end = min(batch_start + batch_size, total)
+            batch = payloads[batch_start:batch_end]
+
+            tasks = []
+            for payload in batch:
+                title = payload.get("title", "Untitled")
+                org = payload.get("organization_name", "Unknown")
+                desc = payload.get("description", "")
+
+                if len(desc) >= 50:
+                    # Create a modified payload for AI processing
+                    ai_payload = {**payload}
+                    tasks.append(_enrich_single_job(parser, ai_payload, title, org, desc))
                 else:
-                    enriched.append(result)
-        except Exception as e:
-            logger.error(f"AI batch processing failed: {e}")
-            enriched.extend(batch)
+                    tasks.append(_async_return(payload))
+
+            # Run all AI calls in parallel
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                for i, result in enumerate(results):
+                    if isinstance(result, Exception):
+                        logger.error(f"AI enrichment failed: {result}")
+                        enriched.append(batch[i])
+                    else:
+                        enriched.append(result)
+            except Exception as e:
+                logger.error(f"AI batch processing failed: {e}")
+                enriched.extend(batch)
 
-        logger.info(f"AI enriched batch: {batch_end}/{total} jobs")
+            logger.info(f"AI enriched batch: {batch_end}/{total} jobs")
+    finally:
+        await parser.aclose()
 
     return enriched
 
@@ -484,20 +620,43 @@ def _algolia_url(app_id: str) -> str:
     return f"https://{app_id.lower()}-dsn.algolia.net/1/indexes/*/queries"
 
 
+def _fetch_algolia_page(
+    url: str,
+    headers: Dict[str, str],
+    base_request: Dict,
+    page: int,
+    result_index: int = 0,
+    length: Optional[int] = None,
+) -> Dict:
+    """
+    Fetch a single page of results.
+
+    With length, only that many hits are requested starting at the page's
+    offset (for a final, partial page).
+    """
+    payload = deepcopy(base_request)
+    request = payload["requests"][0]
+    request["page"] = page
+    if length is not None:
+        request["offset"] = page * request.get("hitsPerPage", 20)
+        request["length"] = length
+    response = requests.post(url, json=payload, headers=headers, timeout=30)
+    response.raise_for_status()
+    return response.json()["results"][result_index]
+
+
 def _paginate_algolia(
     url: str,
     headers: Dict[str, str],
     base_request: Dict,
     result_index: int = 0,
 ) -> Iterable[List[Dict]]:
+    """Yield hits page by page."""
     page = 0
     while True:
-        payload = deepcopy(base_request)
-        payload["requests"][0]["page"] = page
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        result = data["results"][result_index]
+        result = _fetch_algolia_page(
+            url, headers, base_request, page, result_index=result_index
+        )
         yield result.get("hits", [])
         page += 1
         if page >= result.get("nbPages", 0):
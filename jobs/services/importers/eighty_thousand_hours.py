@@ -142,29 +142,41 @@ async def import_80000_hours(
     remote_tags = _remote_80k_facets(url, headers)
     payload = _build_80k_payload(remote_tags)
 
-    # Collect all job payloads first
-    all_payloads = []
+    # Upsert each Algolia page as it arrives instead of collecting every hit,
+    # so a page's payloads (raw hit JSON included) are freed once it is saved
+    stats = {"fetched": 0, "created": 0, "updated": 0, "skipped": 0}
+    saved = 0
+
+    def page_progress(completed: int, total: int) -> None:
+        progress_callback(saved + completed, saved + total)
+
     for hits in _paginate_algolia(url, headers, payload):
+        page_payloads = []
         for hit in hits:
             job_payload = _transform_80k_hit(hit)
             if not job_payload:
                 continue
-            all_payloads.append(job_payload)
-            if limit and len(all_payloads) >= limit:
+            page_payloads.append(job_payload)
+            if limit and stats["fetched"] + len(page_payloads) >= limit:
                 break
-        if limit and len(all_payloads) >= limit:
+        stats["fetched"] += len(page_payloads)
+
+        if not dry_run and page_payloads:
+            page_stats = await batch_upsert_jobs(
+                page_payloads,
+                use_ai=use_ai,
+                batch_size=batch_size,
+                progress_callback=page_progress if progress_callback else None,
+                provider=provider,
+                skip_existing=skip_existing,
+            )
+            for key in ("created", "updated", "skipped"):
+                stats[key] += page_stats.get(key, 0)
+            saved += len(page_payloads)
+
+        if limit and stats["fetched"] >= limit:
             break
 
     if dry_run:
-        return {"fetched": len(all_payloads), "created": 0, "updated": 0}
-
-    # Batch upsert with optional AI processing
-    stats = await batch_upsert_jobs(
-        all_payloads,
-        use_ai=use_ai,
-        batch_size=batch_size,
-        progress_callback=progress_callback,
-        provider=provider,
-        skip_existing=skip_existing,
-    )
+        return {"fetched": stats["fetched"], "created": 0, "updated": 0}
     return stats
@@ -8,20 +8,28 @@ Supports multiple search backends:
 - Google Custom Search API: 100 free queries/day, official Google results
 - DuckDuckGo (ddgs): Free, limited results
 - Serper.dev: 2,500 free searches/month
+- All: every configured backend in parallel, results unioned
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import logging
 import re
 import time
-from typing import Any, Callable, Dict, List, Optional
-from urllib.parse import urlparse
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-import requests
+import httpx
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections
 
-from .common import batch_upsert_jobs
+from jobs.models import Job
+from .common import JobPayload, batch_upsert_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -45,91 +53,158 @@ SOURCE_MAPPING = {
 }
 
 
-def _extract_job_id_from_url(url: str, board_type: str) -> str:
-    """
-    Extract a unique job identifier from the URL.
-    Falls back to URL hash if pattern doesn't match.
+# One pattern per board: detects the board, validates the URL and captures
+# the company slug and job ID in a single match
+_URL_PATTERNS = (
+    ("greenhouse", re.compile(r"https?://boards\.greenhouse\.io/(?P<co>[^/?#]+)/jobs/(?P<id>\d+)")),
+    ("lever", re.compile(r"https?://jobs\.lever\.co/(?P<co>[^/?#]+)/(?P<id>[^/?#]+)")),
+    ("ashby", re.compile(r"https?://jobs\.ashbyhq\.com/(?P<co>[^/?#]+)/(?P<id>[^/?#]+)")),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _slug_to_name(slug: str) -> str:
+    """Company slug from a job board URL to a display name (acme-org -> Acme Org)."""
+    return slug.replace("-", " ").title()
+
+
+def _classify_url(url: str) -> Optional[Tuple[str, str, str]]:
     """
-    parsed = urlparse(url)
-    path = parsed.path.strip("/")
+    Classify a job posting URL.
 
-    if board_type == "greenhouse":
-        # Pattern: boards.greenhouse.io/company/jobs/123456
-        match = re.search(r"/jobs/(\d+)", path)
+    Returns:
+        (board_type, job_id, company_name), or None if the URL isn't a valid
+        Greenhouse, Lever or Ashby job posting
+    """
+    for board_type, pattern in _URL_PATTERNS:
+        match = pattern.match(url)
         if match:
-            return match.group(1)
+            return board_type, match.group("id"), _slug_to_name(match.group("co"))
+    return None
 
-    elif board_type == "lever":
-        # Pattern: jobs.lever.co/company/uuid
-        parts = path.split("/")
-        if len(parts) >= 2:
-            return parts[-1]
 
-    elif board_type == "ashby":
-        # Pattern: jobs.ashbyhq.com/company/uuid
-        parts = path.split("/")
-        if len(parts) >= 2:
-            return parts[-1]
+# Header-driven pacing for the HTTP search backends
+RATE_LIMIT_DEFAULT_PAUSE = 1.0  # seconds, when a limit is hit without Retry-After
+RATE_LIMIT_MAX_PAUSE = 60.0  # longer Retry-After (e.g. daily quota) isn't waited out
+RATE_LIMIT_MAX_RETRIES = 2
 
-    # Fallback: use URL hash
-    return hashlib.md5(url.encode()).hexdigest()[:16]
 
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(retry_at.tzinfo)).total_seconds(), 0.0)
 
-def _extract_company_from_url(url: str, board_type: str) -> str:
-    """Extract company name/slug from the URL."""
-    parsed = urlparse(url)
-    path = parsed.path.strip("/")
-    parts = path.split("/")
 
-    if parts:
-        return parts[0].replace("-", " ").title()
+class _RateLimitPacer:
+    """
+    Response-header-driven pacing for one search backend.
 
-    return "Unknown Organization"
+    Requests only wait while the backend has signalled it is out of quota
+    (Retry-After, or X-RateLimit-Remaining: 0). A 429 is retried after the
+    advertised Retry-After rather than a guessed delay.
+    """
 
+    def __init__(self, name: str):
+        self.name = name
+        self._resume_at = 0.0
+
+    def _update(self, response: httpx.Response) -> Optional[float]:
+        pause = _retry_after_seconds(response.headers.get("Retry-After"))
+        if pause is None and (
+            response.status_code == 429
+            or response.headers.get("X-RateLimit-Remaining") == "0"
+        ):
+            pause = RATE_LIMIT_DEFAULT_PAUSE
+        if pause is not None and pause <= RATE_LIMIT_MAX_PAUSE:
+            self._resume_at = max(self._resume_at, time.monotonic() + pause)
+        return pause
+
+    async def send(
+        self, request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            wait = self._resume_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            response = await request()
+            pause = self._update(response)
+            if response.status_code != 429 or attempt == RATE_LIMIT_MAX_RETRIES:
+                break
+            if pause is None or pause > RATE_LIMIT_MAX_PAUSE:
+                break
+            logger.warning(f"{self.name} rate limited, retrying in {pause:.1f}s")
+        return response
 
-def _is_valid_job_url(url: str, board_type: str) -> bool:
-    """Check if URL looks like a valid job posting URL."""
-    parsed = urlparse(url)
 
-    if board_type == "greenhouse":
-        # Valid: boards.greenhouse.io/company/jobs/123
-        return "/jobs/" in parsed.path and parsed.netloc == "boards.greenhouse.io"
+_CSE_PACER = _RateLimitPacer("Google CSE")
+_SERPER_PACER = _RateLimitPacer("Serper")
 
-    elif board_type == "lever":
-        # Valid: jobs.lever.co/company/uuid
-        parts = parsed.path.strip("/").split("/")
-        return len(parts) >= 2 and parsed.netloc == "jobs.lever.co"
 
-    elif board_type == "ashby":
-        # Valid: jobs.ashbyhq.com/company/uuid
-        parts = parsed.path.strip("/").split("/")
-        return len(parts) >= 2 and parsed.netloc == "jobs.ashbyhq.com"
+CSE_ENDPOINT = "https://www.googleapis.com/customsearch/v1"
 
-    return False
+# Concurrent CSE page requests (Google CSE allows ~10 QPS)
+CSE_MAX_CONCURRENT_REQUESTS = 10
 
+# On-disk cache alias for CSE responses (see CACHES in settings)
+CSE_CACHE_ALIAS = "search"
+CSE_CACHE_TIMEOUT = 60 * 60  # 1 hour
 
-def search_google_cse(
-    query: str,
-    num_results: int = 100,
-    use_date_binning: bool = True,
-) -> List[str]:
+
+def _cse_cache_key(query: str, date_restrict: Optional[str], start: int) -> str:
+    digest = hashlib.blake2b(f"{query}|{date_restrict}|{start}".encode()).hexdigest()
+    return f"cse:{digest}"
+
+
+def _cse_date_bins(use_date_binning: bool) -> List[Tuple[str, Optional[str]]]:
     """
-    Search using Google Custom Search API with date binning for more results.
+    Date bins: (label, dateRestrict parameter).
 
-    Free tier: 100 queries/day
-    Each query returns max 10 results, pagination up to 100 results.
+    dateRestrict: d[number]=days, w[number]=weeks, m[number]=months, y[number]=years
+    Note: bins overlap (month includes week, etc.) but help surface different results
+    """
+    if not use_date_binning:
+        return [("all_time", None)]
+    return [
+        ("last_week", "w1"),
+        ("last_month", "m1"),
+        ("last_3_months", "m3"),
+        ("all_time", None),  # Keep all_time to catch older indexed pages
+    ]
 
-    Date binning strategy:
-    - Split search into date ranges (last week, last month, last 3 months, older)
-    - This helps get more diverse results within query limits
+
+async def _search_cse_items_async(
+    query: str,
+    num_results: int,
+    use_date_binning: bool,
+    cse_semaphore: Optional[asyncio.Semaphore] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Run the (date bin, page) CSE requests concurrently.
+
+    Page 1 of every bin goes first; later pages are only requested up to the
+    bin's reported totalResults, so sparse bins don't spend paid queries on
+    empty pages. All pages go out over one HTTP/2 connection and are merged
+    back in bin/page order. Requests not yet sent are skipped once enough
+    unique URLs are found, a bin runs out of results, or CSE returns 429.
 
     Args:
         query: The search query
-        num_results: Target number of results (will use multiple queries if needed)
+        num_results: Target number of unique URLs
         use_date_binning: Use date ranges to get more diverse results
+        cse_semaphore: Bounds in-flight CSE requests; pass one semaphore to
+            every concurrent search so they share the ~10 QPS budget
 
     Returns:
-        List of unique URLs from search results
+        Search result items in bin/page order, or None if CSE isn't configured
     """
     api_key = getattr(settings, "GOOGLE_CSE_API_KEY", None)
     cx = getattr(settings, "GOOGLE_CSE_CX", None)
@@ -139,83 +214,177 @@ def search_google_cse(
             "GOOGLE_CSE_API_KEY or GOOGLE_CSE_CX not set. "
             "Configure in settings.py"
         )
-        return []
-
-    # Date bins: (label, dateRestrict parameter)
-    # dateRestrict: d[number]=days, w[number]=weeks, m[number]=months, y[number]=years
-    # Note: bins overlap (month includes week, etc.) but help surface different results
-    date_bins = [
-        ("last_week", "w1"),
-        ("last_month", "m1"),
-        ("last_3_months", "m3"),
-        ("all_time", None),  # Keep all_time to catch older indexed pages
-    ] if use_date_binning else [("all_time", None)]
-
-    all_urls = set()
+        return None
+
+    # Paginate through results (start: 1, 11, 21, ... up to 91) - max 10 pages of 10
+    tasks = [
+        (date_label, date_restrict, start)
+        for date_label, date_restrict in _cse_date_bins(use_date_binning)
+        for start in range(1, 92, 10)
+    ]
+    semaphore = cse_semaphore or asyncio.Semaphore(CSE_MAX_CONCURRENT_REQUESTS)
+    stop = asyncio.Event()
+    bin_totals: Dict[str, int] = {}  # date_label -> last useful start offset
+    pages: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+    seen_urls = set()
     queries_used = 0
 
-    for date_label, date_restrict in date_bins:
-        if len(all_urls) >= num_results:
-            break
-
-        # Paginate through results (start: 1, 11, 21, ... up to 91)
-        for start in range(1, 92, 10):  # Max 10 pages of 10 results
-            if len(all_urls) >= num_results:
-                break
+    cache = caches[CSE_CACHE_ALIAS]
+
+    async def request_page(
+        client: httpx.AsyncClient,
+        date_label: str,
+        date_restrict: Optional[str],
+        start: int,
+    ) -> Optional[Dict[str, Any]]:
+        nonlocal queries_used
+        async with semaphore:
+            if stop.is_set() or start > bin_totals.get(date_label, start):
+                return None
+
+            params = {
+                "key": api_key,
+                "cx": cx,
+                "q": query,
+                "start": start,
+                "num": 10,  # Max per request
+            }
+            if date_restrict:
+                params["dateRestrict"] = date_restrict
 
+            logger.info(f"Google CSE: {query} (start={start}, date={date_label})")
             try:
-                params = {
-                    "key": api_key,
-                    "cx": cx,
-                    "q": query,
-                    "start": start,
-                    "num": 10,  # Max per request
-                }
-                if date_restrict:
-                    params["dateRestrict"] = date_restrict
-
-                logger.info(f"Google CSE: {query} (start={start}, date={date_label})")
-                response = requests.get(
-                    "https://www.googleapis.com/customsearch/v1",
-                    params=params,
-                    timeout=30,
+                response = await _CSE_PACER.send(
+                    lambda: client.get(CSE_ENDPOINT, params=params)
                 )
                 queries_used += 1
 
                 if response.status_code == 429:
                     logger.warning("Google CSE rate limit reached")
-                    break
+                    stop.set()
+                    return None
 
                 response.raise_for_status()
                 data = response.json()
+            except httpx.HTTPError as e:
+                logger.error(f"Google CSE request failed: {e}")
+                return None
+            except Exception as e:
+                logger.error(f"Google CSE error: {e}")
+                return None
+
+        return data
+
+    async def fetch_page(
+        client: httpx.AsyncClient,
+        date_label: str,
+        date_restrict: Optional[str],
+        start: int,
+    ) -> None:
+        cache_key = _cse_cache_key(query, date_restrict, start)
+        data = await cache.aget(cache_key)
+        if data is None:
+            data = await request_page(client, date_label, date_restrict, start)
+            if data is None:
+                return
+            await cache.aset(cache_key, data, CSE_CACHE_TIMEOUT)
+        else:
+            logger.debug(f"Google CSE cache hit (start={start}, date={date_label})")
 
-                items = data.get("items", [])
-                if not items:
-                    logger.debug(f"No more results for date={date_label}, start={start}")
-                    break
+        items = data.get("items", [])
+        if not items:
+            logger.debug(f"No more results for date={date_label}, start={start}")
+            bin_totals[date_label] = min(bin_totals.get(date_label, start), start)
+            return
+        pages[(date_label, start)] = items
 
-                for item in items:
-                    url = item.get("link")
-                    if url:
-                        all_urls.add(url)
-                        logger.debug(f"Found: {url}")
+        # Skip pages past the reported total for this bin
+        total_results = int(data.get("searchInformation", {}).get("totalResults", 0))
+        bin_totals[date_label] = min(bin_totals.get(date_label, total_results), total_results)
 
-                # Check if there are more results
-                total_results = int(data.get("searchInformation", {}).get("totalResults", 0))
-                if start + 10 > total_results:
-                    break
+        for item in items:
+            url = item.get("link")
+            if url:
+                seen_urls.add(url)
+        if len(seen_urls) >= num_results:
+            stop.set()
+
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        # First pages report each bin's totalResults (or come back empty)
+        await asyncio.gather(
+            *(fetch_page(client, *task) for task in tasks if task[2] == 1)
+        )
+        # Fan out the remaining pages only up to min(totalResults, 91); bins
+        # whose first page was empty or failed have no total and are skipped
+        await asyncio.gather(
+            *(
+                fetch_page(client, date_label, date_restrict, start)
+                for date_label, date_restrict, start in tasks
+                if 1 < start <= bin_totals.get(date_label, 0)
+            )
+        )
 
-            except requests.RequestException as e:
-                logger.error(f"Google CSE request failed: {e}")
-                break
-            except Exception as e:
-                logger.error(f"Google CSE error: {e}")
-                break
+    logger.info(f"Google CSE: {len(seen_urls)} unique URLs found using {queries_used} queries")
+    return [
+        item
+        for date_label, _, start in tasks
+        for item in pages.get((date_label, start), [])
+    ]
+
+
+async def search_google_cse_async(
+    query: str,
+    num_results: int = 100,
+    use_date_binning: bool = True,
+    cse_semaphore: Optional[asyncio.Semaphore] = None,
+) -> List[str]:
+    """
+    Search using Google Custom Search API with date binning for more results.
+
+    Free tier: 100 queries/day
+    Each query returns max 10 results, pagination up to 100 results.
+
+    Date binning strategy:
+    - Split search into date ranges (last week, last month, last 3 months, older)
+    - This helps get more diverse results within query limits
+
+    Args:
+        query: The search query
+        num_results: Target number of results (will use multiple queries if needed)
+        use_date_binning: Use date ranges to get more diverse results
+        cse_semaphore: Shared bound on in-flight CSE requests
+
+    Returns:
+        List of unique URLs from search results
+    """
+    items = await _search_cse_items_async(
+        query, num_results, use_date_binning, cse_semaphore
+    )
+    if items is None:
+        return []
+
+    # dict preserves first-seen order while de-duplicating across bins
+    all_urls: Dict[str, None] = {}
+    for item in items:
+        url = item.get("link")
+        if url and url not in all_urls:
+            all_urls[url] = None
+            logger.debug(f"Found: {url}")
 
-    logger.info(f"Google CSE: {len(all_urls)} unique URLs found using {queries_used} queries")
     return list(all_urls)
 
 
+def search_google_cse(
+    query: str,
+    num_results: int = 100,
+    use_date_binning: bool = True,
+) -> List[str]:
+    """Synchronous wrapper for search_google_cse_async."""
+    return asyncio.run(
+        search_google_cse_async(query, num_results=num_results, use_date_binning=use_date_binning)
+    )
+
+
 def search_duckduckgo(query: str, num_results: int = 100) -> List[str]:
     """
     Search using DuckDuckGo via the ddgs library.
@@ -252,7 +421,7 @@ def search_duckduckgo(query: str, num_results: int = 100) -> List[str]:
     return urls
 
 
-def search_serper(query: str, num_results: int = 100) -> List[str]:
+async def search_serper_async(query: str, num_results: int = 100) -> List[str]:
     """
     Search Google via Serper.dev API.
 
@@ -277,18 +446,20 @@ def search_serper(query: str, num_results: int = 100) -> List[str]:
     urls = []
     try:
         logger.info(f"Searching via Serper: {query}")
-        response = requests.post(
-            "https://google.serper.dev/search",
-            headers={
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json",
-            },
-            json={
-                "q": query,
-                "num": min(num_results, 100),  # Serper max is 100
-            },
-            timeout=30,
-        )
+        async with httpx.AsyncClient(http2=True, timeout=30) as client:
+            response = await _SERPER_PACER.send(
+                lambda: client.post(
+                    "https://google.serper.dev/search",
+                    headers={
+                        "X-API-KEY": api_key,
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "q": query,
+                        "num": min(num_results, 100),  # Serper max is 100
+                    },
+                )
+            )
         response.raise_for_status()
         data = response.json()
 
@@ -298,7 +469,7 @@ def search_serper(query: str, num_results: int = 100) -> List[str]:
                 urls.append(url)
                 logger.debug(f"Found URL: {url}")
 
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Serper API request failed: {e}")
     except Exception as e:
         logger.error(f"Serper search failed: {e}")
@@ -306,6 +477,11 @@ def search_serper(query: str, num_results: int = 100) -> List[str]:
     return urls
 
 
+def search_serper(query: str, num_results: int = 100) -> List[str]:
+    """Synchronous wrapper for search_serper_async."""
+    return asyncio.run(search_serper_async(query, num_results=num_results))
+
+
 def search_google_free(query: str, num_results: int = 100, delay: float = 2.0) -> List[str]:
     """
     Search Google using googlesearch-python (free but unreliable).
@@ -338,22 +514,12 @@ def search_google_free(query: str, num_results: int = 100, delay: float = 2.0) -
     return urls
 
 
-def _detect_board_type(url: str) -> Optional[str]:
-    """Detect which job board a URL belongs to."""
-    if "boards.greenhouse.io" in url:
-        return "greenhouse"
-    elif "jobs.lever.co" in url:
-        return "lever"
-    elif "jobs.ashbyhq.com" in url:
-        return "ashby"
-    return None
-
-
-def search_google_cse_unified(
+async def search_google_cse_unified_async(
     query: str = UNIFIED_SEARCH_QUERY,
     num_results: int = 200,
     use_date_binning: bool = True,
-) -> List[Dict[str, Any]]:
+    existing_ids: Optional[Set[Tuple[str, str]]] = None,
+) -> List[JobPayload]:
     """
     Search using Google CSE with a unified query (for CSEs restricted to job sites).
 
@@ -364,135 +530,143 @@ def search_google_cse_unified(
         query: Search query (default: "non-profit" remote)
         num_results: Target number of results
         use_date_binning: Use date ranges to get more results
+        existing_ids: (source, external_id) pairs already imported; skipped
 
     Returns:
-        List of job payload dicts ready for upsert
+        List of JobPayload tuples ready for upsert
     """
-    api_key = getattr(settings, "GOOGLE_CSE_API_KEY", None)
-    cx = getattr(settings, "GOOGLE_CSE_CX", None)
-
-    if not api_key or not cx:
-        logger.error("GOOGLE_CSE_API_KEY or GOOGLE_CSE_CX not set")
+    items = await _search_cse_items_async(query, num_results, use_date_binning)
+    if items is None:
         return []
 
-    date_bins = [
-        ("last_week", "w1"),
-        ("last_month", "m1"),
-        ("last_3_months", "m3"),
-        ("all_time", None),
-    ] if use_date_binning else [("all_time", None)]
-
     all_urls = {}  # url -> raw item data
-    queries_used = 0
-
-    for date_label, date_restrict in date_bins:
-        if len(all_urls) >= num_results:
-            break
+    for item in items:
+        url = item.get("link")
+        if url and url not in all_urls:
+            all_urls[url] = item
 
-        for start in range(1, 92, 10):
-            if len(all_urls) >= num_results:
-                break
-
-            try:
-                params = {
-                    "key": api_key,
-                    "cx": cx,
-                    "q": query,
-                    "start": start,
-                    "num": 10,
-                }
-                if date_restrict:
-                    params["dateRestrict"] = date_restrict
-
-                logger.info(f"Google CSE unified: {query} (start={start}, date={date_label})")
-                response = requests.get(
-                    "https://www.googleapis.com/customsearch/v1",
-                    params=params,
-                    timeout=30,
-                )
-                queries_used += 1
-
-                if response.status_code == 429:
-                    logger.warning("Google CSE rate limit reached")
-                    break
-
-                response.raise_for_status()
-                data = response.json()
-
-                items = data.get("items", [])
-                if not items:
-                    break
-
-                for item in items:
-                    url = item.get("link")
-                    if url and url not in all_urls:
-                        all_urls[url] = item
-
-                total_results = int(data.get("searchInformation", {}).get("totalResults", 0))
-                if start + 10 > total_results:
-                    break
-
-            except Exception as e:
-                logger.error(f"Google CSE error: {e}")
-                break
-
-    logger.info(f"Google CSE unified: {len(all_urls)} unique URLs using {queries_used} queries")
+    logger.info(f"Google CSE unified: {len(all_urls)} unique URLs")
 
     # Convert to payloads, detecting board type from URL
     payloads = []
     for url, item in all_urls.items():
-        board_type = _detect_board_type(url)
-        if not board_type:
-            logger.debug(f"Skipping unknown board URL: {url}")
+        result = _classify_url(url)
+        if result is None:
+            logger.debug(f"Skipping unknown or invalid job URL: {url}")
             continue
-
-        if not _is_valid_job_url(url, board_type):
-            logger.debug(f"Skipping invalid job URL: {url}")
+        board_type, job_id, company_name = result
+        if existing_ids and (SOURCE_MAPPING[board_type], job_id) in existing_ids:
             continue
 
-        job_id = _extract_job_id_from_url(url, board_type)
-        company_name = _extract_company_from_url(url, board_type)
-
-        payload = {
-            "source": SOURCE_MAPPING[board_type],
-            "external_id": job_id,
-            "title": item.get("title", f"Job at {company_name}"),
-            "organization_name": company_name,
-            "organization_url": "",
-            "description": item.get("snippet", ""),
-            "requirements": "",
-            "location": "Remote",
-            "job_type": "full-time",
-            "application_url": url,
-            "raw_data": {
+        payload = JobPayload(
+            source=SOURCE_MAPPING[board_type],
+            external_id=job_id,
+            title=item.get("title", f"Job at {company_name}"),
+            organization_name=company_name,
+            organization_url="",
+            description=item.get("snippet", ""),
+            requirements="",
+            location="Remote",
+            job_type="full-time",
+            application_url=url,
+            raw_data={
                 "source_url": url,
                 "board_type": board_type,
                 "google_title": item.get("title"),
                 "google_snippet": item.get("snippet"),
                 "needs_crawling": True,
             },
-        }
+        )
         payloads.append(payload)
 
     return payloads
 
 
-def search_google(
+def search_google_cse_unified(
+    query: str = UNIFIED_SEARCH_QUERY,
+    num_results: int = 200,
+    use_date_binning: bool = True,
+) -> List[JobPayload]:
+    """Synchronous wrapper for search_google_cse_unified_async."""
+    return asyncio.run(
+        search_google_cse_unified_async(
+            query, num_results=num_results, use_date_binning=use_date_binning
+        )
+    )
+
+
+# Per-backend time budget when fanning out with backend="all"
+SEARCH_BACKEND_TIMEOUT = 15
+
+
+async def search_google_all(
+    query: str,
+    num_results: int = 100,
+    use_date_binning: bool = True,
+    cse_semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, List[str]]:
+    """
+    Search every configured backend concurrently and union the results.
+
+    Each backend gets SEARCH_BACKEND_TIMEOUT seconds so one slow provider
+    doesn't hold up the rest; failed or timed-out backends are skipped.
+
+    Returns:
+        Dict of url -> names of the backends that returned it, in first-seen order
+    """
+    backends: Dict[str, Any] = {}
+    if getattr(settings, "GOOGLE_CSE_API_KEY", None) and getattr(settings, "GOOGLE_CSE_CX", None):
+        backends["google_cse"] = search_google_cse_async(
+            query,
+            num_results=num_results,
+            use_date_binning=use_date_binning,
+            cse_semaphore=cse_semaphore,
+        )
+    if getattr(settings, "SERPER_API_KEY", None):
+        backends["serper"] = search_serper_async(query, num_results=num_results)
+    backends["duckduckgo"] = asyncio.to_thread(
+        search_duckduckgo, query, num_results=num_results
+    )
+
+    results = await asyncio.gather(
+        *(asyncio.wait_for(search, timeout=SEARCH_BACKEND_TIMEOUT) for search in backends.values()),
+        return_exceptions=True,
+    )
+
+    url_backends: Dict[str, List[str]] = {}
+    for name, result in zip(backends, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Search backend {name} failed or timed out: {result!r}")
+            continue
+        logger.info(f"Search backend {name}: {len(result)} URLs")
+        for url in result:
+            url_backends.setdefault(url, []).append(name)
+
+    logger.info(f"All backends: {len(url_backends)} unique URLs")
+    return url_backends
+
+
+async def search_google_async(
     query: str,
     num_results: int = 100,
     delay: float = 2.0,
     backend: str = "auto",
     use_date_binning: bool = True,
+    cse_semaphore: Optional[asyncio.Semaphore] = None,
 ) -> List[str]:
     """
     Search and return list of URLs.
 
+    CSE and Serper are awaited natively; the library-based backends
+    (DuckDuckGo, googlesearch) run in a worker thread.
+
     Args:
         query: The search query
         num_results: Maximum number of results to fetch
         delay: Delay between requests (only for googlesearch backend)
         backend: 'google_cse', 'serper', 'duckduckgo', 'googlesearch', or 'auto'
         use_date_binning: Use date ranges to get more results (google_cse only)
+        cse_semaphore: Shared bound on in-flight CSE requests (google_cse only)
 
     Returns:
         List of URLs from search results
@@ -510,81 +684,172 @@ def search_google(
             logger.warning("Using DuckDuckGo (limited results)")
 
     if backend == "google_cse":
-        return search_google_cse(query, num_results=num_results, use_date_binning=use_date_binning)
+        return await search_google_cse_async(
+            query,
+            num_results=num_results,
+            use_date_binning=use_date_binning,
+            cse_semaphore=cse_semaphore,
+        )
     elif backend == "serper":
-        return search_serper(query, num_results=num_results)
+        return await search_serper_async(query, num_results=num_results)
     elif backend == "duckduckgo":
-        return search_duckduckgo(query, num_results=num_results)
+        return await asyncio.to_thread(search_duckduckgo, query, num_results=num_results)
     elif backend == "googlesearch":
-        return search_google_free(query, num_results=num_results, delay=delay)
+        return await asyncio.to_thread(
+            search_google_free, query, num_results=num_results, delay=delay
+        )
     else:
         logger.error(f"Unknown search backend: {backend}")
         return []
 
 
-def fetch_urls_for_board(
+def search_google(
+    query: str,
+    num_results: int = 100,
+    delay: float = 2.0,
+    backend: str = "auto",
+    use_date_binning: bool = True,
+) -> List[str]:
+    """Synchronous wrapper for search_google_async."""
+    return asyncio.run(
+        search_google_async(
+            query,
+            num_results=num_results,
+            delay=delay,
+            backend=backend,
+            use_date_binning=use_date_binning,
+        )
+    )
+
+
+def _board_payloads(
+    urls: List[str],
+    board_type: str,
+    existing_ids: Optional[Set[Tuple[str, str]]] = None,
+    url_backends: Optional[Dict[str, List[str]]] = None,
+) -> List[JobPayload]:
+    """
+    Build placeholder job payloads from search result URLs for one board.
+
+    URLs whose (source, external_id) is in existing_ids are skipped before
+    any payload is built. url_backends (from search_google_all) records
+    which search backends found each URL in raw_data.
+    """
+    # Drop duplicates (overlapping date bins, multiple backends) before
+    # any per-URL parsing, keeping first-seen order
+    urls = list(dict.fromkeys(urls))
+
+    payloads = []
+    for url in urls:
+        result = _classify_url(url)
+        if result is None or result[0] != board_type:
+            logger.debug(f"Skipping invalid URL: {url}")
+            continue
+        _, job_id, company_name = result
+        if existing_ids and (SOURCE_MAPPING[board_type], job_id) in existing_ids:
+            continue
+
+        payload = JobPayload(
+            source=SOURCE_MAPPING[board_type],
+            external_id=job_id,
+            title=f"Job at {company_name}",  # Placeholder - will be updated by crawler
+            organization_name=company_name,
+            organization_url="",
+            description="",  # Placeholder - will be updated by crawler
+            requirements="",
+            location="Remote",
+            job_type="full-time",
+            application_url=url,
+            raw_data={
+                "source_url": url,
+                "board_type": board_type,
+                "needs_crawling": True,  # Flag for the crawler
+            },
+        )
+        if url_backends:
+            payload.raw_data["search_backends"] = url_backends.get(url, [])
+        payloads.append(payload)
+        logger.info(f"Found job: {url}")
+
+    return payloads
+
+
+async def fetch_urls_for_board_async(
     board_type: str,
     num_results: int = 100,
     delay: float = 2.0,
     backend: str = "auto",
     use_date_binning: bool = True,
-) -> List[Dict[str, Any]]:
+    existing_ids: Optional[Set[Tuple[str, str]]] = None,
+    cse_semaphore: Optional[asyncio.Semaphore] = None,
+) -> List[JobPayload]:
     """
     Fetch job URLs for a specific job board type.
 
     Args:
         board_type: One of 'greenhouse', 'lever', 'ashby'
         num_results: Maximum results per query
-        delay: Delay between requests
+        delay: Delay between requests (googlesearch backend only)
         backend: Search backend to use
         use_date_binning: Use date ranges to get more results (google_cse only)
+        existing_ids: (source, external_id) pairs already imported; skipped
+        cse_semaphore: Shared bound on in-flight CSE requests (google_cse only)
 
     Returns:
-        List of job payload dicts ready for upsert
+        List of JobPayload tuples ready for upsert
     """
     if board_type not in SEARCH_QUERIES:
         logger.error(f"Unknown board type: {board_type}")
         return []
 
     query = SEARCH_QUERIES[board_type]
-    urls = search_google(
+    if backend == "all":
+        url_backends = await search_google_all(
+            query,
+            num_results=num_results,
+            use_date_binning=use_date_binning,
+            cse_semaphore=cse_semaphore,
+        )
+        return _board_payloads(list(url_backends), board_type, existing_ids, url_backends)
+
+    urls = await search_google_async(
         query,
         num_results=num_results,
         delay=delay,
         backend=backend,
         use_date_binning=use_date_binning,
+        cse_semaphore=cse_semaphore,
     )
+    return _board_payloads(urls, board_type, existing_ids)
 
-    payloads = []
-    for url in urls:
-        if not _is_valid_job_url(url, board_type):
-            logger.debug(f"Skipping invalid URL: {url}")
-            continue
 
-        job_id = _extract_job_id_from_url(url, board_type)
-        company_name = _extract_company_from_url(url, board_type)
-
-        payload = {
-            "source": SOURCE_MAPPING[board_type],
-            "external_id": job_id,
-            "title": f"Job at {company_name}",  # Placeholder - will be updated by crawler
-            "organization_name": company_name,
-            "organization_url": "",
-            "description": "",  # Placeholder - will be updated by crawler
-            "requirements": "",
-            "location": "Remote",
-            "job_type": "full-time",
-            "application_url": url,
-            "raw_data": {
-                "source_url": url,
-                "board_type": board_type,
-                "needs_crawling": True,  # Flag for the crawler
-            },
-        }
-        payloads.append(payload)
-        logger.info(f"Found job: {url}")
+def fetch_urls_for_board(
+    board_type: str,
+    num_results: int = 100,
+    delay: float = 2.0,
+    backend: str = "auto",
+    use_date_binning: bool = True,
+) -> List[JobPayload]:
+    """Synchronous wrapper for fetch_urls_for_board_async."""
+    return asyncio.run(
+        fetch_urls_for_board_async(
+            board_type,
+            num_results=num_results,
+            delay=delay,
+            backend=backend,
+            use_date_binning=use_date_binning,
+        )
+    )
 
-    return payloads
+
+def _existing_job_ids() -> Set[Tuple[str, str]]:
+    """(source, external_id) pairs already imported from the job boards."""
+    close_old_connections()
+    return set(
+        Job.objects.filter(source__in=SOURCE_MAPPING.values()).values_list(
+            "source", "external_id"
+        )
+    )
 
 
 async def import_google_search(
@@ -611,43 +876,54 @@ async def import_google_search(
         use_ai: Whether to use AI for enrichment (not recommended for URL-only imports)
         batch_size: Batch size for AI processing
         num_results: Max results per Google search
-        delay: Delay between Google requests
-        backend: Search backend ('google_cse', 'serper', 'duckduckgo', 'auto')
+        delay: Delay between requests (googlesearch backend only)
+        backend: Search backend ('google_cse', 'serper', 'duckduckgo', 'auto', or
+            'all' to query every configured backend concurrently)
         use_date_binning: Use date ranges to get more results (google_cse only)
         unified: Use unified search (single query for CSE restricted to job sites)
         progress_callback: Progress callback for AI processing
+        skip_existing: Skip URLs whose jobs were already imported
 
     Returns:
         Dict with fetched, created, updated counts
     """
+    # Load already-imported IDs once so re-runs skip them before any
+    # payload is built
+    existing_ids = None
+    if skip_existing:
+        existing_ids = await sync_to_async(_existing_job_ids, thread_sensitive=True)()
+
     if unified:
         # Use efficient unified search for CSEs restricted to job board sites
         logger.info("Using unified search (single query for all job boards)")
-        all_payloads = search_google_cse_unified(
+        all_payloads = await search_google_cse_unified_async(
             num_results=num_results,
             use_date_binning=use_date_binning,
+            existing_ids=existing_ids,
         )
     else:
         # Search each board separately
         if boards is None:
             boards = list(SEARCH_QUERIES.keys())
 
-        all_payloads = []
+        # Boards are searched concurrently; Google CSE has one global QPS
+        # budget, so every board's CSE requests share a single semaphore
+        cse_semaphore = asyncio.Semaphore(CSE_MAX_CONCURRENT_REQUESTS)
 
-        for board_type in boards:
+        async def _fetch_board(board_type: str) -> List[JobPayload]:
             logger.info(f"Fetching URLs for {board_type}...")
-            payloads = fetch_urls_for_board(
+            return await fetch_urls_for_board_async(
                 board_type,
                 num_results=num_results,
                 delay=delay,
                 backend=backend,
                 use_date_binning=use_date_binning,
+                existing_ids=existing_ids,
+                cse_semaphore=cse_semaphore,
             )
-            all_payloads.extend(payloads)
 
-            # Add delay between different board searches to avoid rate limiting
-            if board_type != boards[-1]:
-                time.sleep(delay)
+        results = await asyncio.gather(*(_fetch_board(b) for b in boards))
+        all_payloads = [payload for payloads in results for payload in payloads]
 
     if limit:
         all_payloads = all_payloads[:limit]
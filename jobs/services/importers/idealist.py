@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 from typing import Callable, Dict, Optional
 
 from django.conf import settings
 
 from jobs.models import Job
 from .common import (
+    JobPayload,
     _algolia_headers,
     _algolia_url,
+    _fetch_algolia_page,
     _map_job_type,
-    _paginate_algolia,
     _timestamp_to_datetime,
     batch_upsert_jobs,
 )
@@ -51,13 +54,9 @@ def _build_idealist_payload() -> Dict:
     }
 
 
-def _transform_idealist_hit(hit: Dict) -> Dict:
-    location_bits = ["Remote"]
-    if hit.get("remoteCountry"):
-        location_bits.append(hit["remoteCountry"])
-    elif hit.get("remoteZone"):
-        location_bits.append(hit["remoteZone"])
-    location = " · ".join(location_bits)
+def _transform_idealist_hit(hit: Dict) -> JobPayload:
+    region = hit.get("remoteCountry") or hit.get("remoteZone")
+    location = f"Remote · {region}" if region else "Remote"
 
     if isinstance(hit.get("url"), dict):
         primary_url = (
@@ -82,28 +81,28 @@ def _transform_idealist_hit(hit: Dict) -> Dict:
     salary_min = hit.get("salaryMinimum")
     salary_max = hit.get("salaryMaximum")
 
-    return {
-        "source": Job.Source.IDEALIST,
-        "external_id": hit.get("objectID"),
-        "title": hit.get("name", "Untitled role"),
-        "description": hit.get("description", ""),
-        "requirements": hit.get("description", ""),
-        "location": location,
-        "job_type": _map_job_type(job_type_label),
-        "application_url": application_url or "",
-        "application_email": "",
-        "salary_min": salary_min,
-        "salary_max": salary_max,
-        "salary_currency": (hit.get("salaryCurrency") or "USD")[:3],
-        "posted_at": _timestamp_to_datetime(hit.get("published")),
-        "expires_at": None,
-        "category_name": category_name,
-        "organization_name": hit.get("orgName") or "Unknown Organization",
-        "organization_description": hit.get("orgDescription", ""),
-        "organization_url": hit.get("orgUrl", ""),
-        "is_featured": False,
-        "raw_data": hit,
-    }
+    return JobPayload(
+        source=Job.Source.IDEALIST,
+        external_id=hit.get("objectID"),
+        title=hit.get("name", "Untitled role"),
+        description=hit.get("description", ""),
+        requirements=hit.get("description", ""),
+        location=location,
+        job_type=_map_job_type(job_type_label),
+        application_url=application_url or "",
+        application_email="",
+        salary_min=salary_min,
+        salary_max=salary_max,
+        salary_currency=(hit.get("salaryCurrency") or "USD")[:3],
+        posted_at=_timestamp_to_datetime(hit.get("published")),
+        expires_at=None,
+        category_name=category_name,
+        organization_name=hit.get("orgName") or "Unknown Organization",
+        organization_description=hit.get("orgDescription", ""),
+        organization_url=hit.get("orgUrl", ""),
+        is_featured=False,
+        raw_data=hit,
+    )
 
 
 async def import_idealist(
@@ -136,27 +135,69 @@ async def import_idealist(
     url = _algolia_url(app_id)
     payload = _build_idealist_payload()
 
-    # Collect all job payloads first
-    all_payloads = []
-    for hits in _paginate_algolia(url, headers, payload):
-        for hit in hits:
-            job_payload = _transform_idealist_hit(hit)
-            all_payloads.append(job_payload)
-            if limit and len(all_payloads) >= limit:
+    hits_per_page = payload["requests"][0]["hitsPerPage"]
+
+    def fetch_page(page: int) -> Dict:
+        # Size the last page to the limit instead of over-fetching
+        length = None
+        if limit:
+            remaining = limit - page * hits_per_page
+            if remaining < hits_per_page:
+                length = remaining
+        return _fetch_algolia_page(url, headers, payload, page, length=length)
+
+    # Page 0 tells us nbPages; the remaining pages are independent, so fetch
+    # them all concurrently and upsert each one in order as it arrives.
+    first_page = await asyncio.to_thread(fetch_page, 0)
+    nb_pages = first_page.get("nbPages", 0)
+    if limit:
+        nb_pages = min(nb_pages, math.ceil(limit / hits_per_page))
+    page_tasks = [
+        asyncio.create_task(asyncio.to_thread(fetch_page, page))
+        for page in range(1, nb_pages)
+    ]
+
+    stats = {"fetched": 0, "created": 0, "updated": 0, "skipped": 0}
+    saved = 0
+
+    def page_progress(completed: int, total: int) -> None:
+        progress_callback(saved + completed, saved + total)
+
+    try:
+        for page_result in [first_page, *page_tasks]:
+            if isinstance(page_result, asyncio.Task):
+                page_result = await page_result
+            hits = page_result.get("hits", [])
+
+            # Only transform hits that fit under the limit
+            if limit:
+                hits = hits[: limit - stats["fetched"]]
+            page_payloads = [_transform_idealist_hit(hit) for hit in hits]
+            stats["fetched"] += len(page_payloads)
+
+            if not dry_run and page_payloads:
+                page_stats = await batch_upsert_jobs(
+                    page_payloads,
+                    use_ai=use_ai,
+                    batch_size=batch_size,
+                    progress_callback=page_progress if progress_callback else None,
+                    provider=provider,
+                    skip_existing=skip_existing,
+                )
+                for key in ("created", "updated", "skipped"):
+                    stats[key] += page_stats.get(key, 0)
+                saved += len(page_payloads)
+
+            if limit and stats["fetched"] >= limit:
                 break
-        if limit and len(all_payloads) >= limit:
-            break
+    finally:
+        # Pages left unread after the limit or an error: cancel what hasn't
+        # finished and collect every result so no task is left dangling.
+        for task in page_tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*page_tasks, return_exceptions=True)
 
     if dry_run:
-        return {"fetched": len(all_payloads), "created": 0, "updated": 0}
-
-    # Batch upsert with optional AI processing
-    stats = await batch_upsert_jobs(
-        all_payloads,
-        use_ai=use_ai,
-        batch_size=batch_size,
-        progress_callback=progress_callback,
-        provider=provider,
-        skip_existing=skip_existing,
-    )
+        return {"fetched": stats["fetched"], "created": 0, "updated": 0}
     return stats
@@ -6,21 +6,26 @@ Webflow-based site with server-side rendering.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone as dt_timezone
-from typing import Callable, Dict, List, Optional
-from urllib.parse import urljoin
+from typing import Callable, Dict, List, NamedTuple, Optional
+from urllib.parse import urljoin, urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.utils import timezone
+from lxml import etree
+from lxml import html as lxml_html
 
 from jobs.models import Job
 
 from .common import batch_upsert_jobs, _map_job_type
-from ..crawlers.base import html_to_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +36,94 @@ FETCH_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# Shared session so listing and description fetches reuse pooled keep-alive
+# connections instead of a new TCP/TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.headers.update(FETCH_HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
 BASE_URL = "https://jobs.probablygood.org"
 REMOTE_JOBS_URL = f"{BASE_URL}/?remote=remote"
 
 # Pagination query param discovered from the site
 PAGE_PARAM = "b74fbe7d_page"
 
+# Description fetches hit many different hosts, so run them concurrently
+# while keeping per-host load polite
+DESCRIPTION_MAX_WORKERS = 16
+DESCRIPTION_PER_HOST_CONCURRENCY = 2
+
+# Only the first part of a scraped job page is read; the extracted text is
+# truncated to 8000 chars anyway and some career pages run to several MB
+MAX_HTML_BYTES = 512 * 1024
+
+# Precompiled patterns for card and description parsing
+_RE_ADDED_PREFIX = re.compile(r"^added\s+")
+_RE_DAYS_AGO = re.compile(r"(\d+)\s*days?\s*ago")
+_RE_MONTH_DAY = re.compile(r"([a-z]{3})\s+(\d{1,2})")
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+    "may": 5, "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+_RE_SALARY_AMOUNTS = re.compile(r"\$?([\d,]+)")
+# Card patterns run against the lower-cased card text, so no IGNORECASE
+_RE_ADDED_FULL = re.compile(r"added\s*([a-z]+\s+\d+|\d+\s*days?\s*ago|today|yesterday)")
+_RE_SALARY_NUM = re.compile(r"(\d{2,3}),?(\d{3})")
+_RE_WS = re.compile(r"\n\s*\n\s*\n")
+# External links that look like an application / ATS page
+_RE_APPLY_KW = re.compile(r"careers|jobs|workday|greenhouse|lever|ashby|apply", re.I)
+_LOCATION_COUNTRIES = r"(?:usa|uk|canada|germany|australia|netherlands|uganda|india)"
+# One anchored match over the card text. Each alternative is tried across the
+# whole text before the next, so "Remote, USA" still wins over an earlier
+# "City, UK" exactly as the separate patterns did
+_RE_LOCATION = re.compile(
+    rf"(?:.*?(?P<remote_country>remote\s*[,\s]*[\w\s,]+{_LOCATION_COUNTRIES})"
+    rf"|.*?(?P<city_country>[\w\s]+,\s*{_LOCATION_COUNTRIES})"
+    r"|.*?(?P<remote>remote))",
+    re.DOTALL,
+)
+
+# Elements a job link's up-walk may stop at: block containers around a job
+# link whose text carries card metadata (an "Added" date or a salary).
+# Evaluated once per listing page instead of reading text per link and level
+_CARD_CONTAINERS = etree.XPath(
+    "//*[self::div or self::article or self::li or self::section]"
+    "[.//a[contains(@href, '/job-postings/')]]"
+    "[contains(., 'Added') or contains(., '$')]"
+)
+
+# Page chrome removed before extracting a job description
+_STRIP_TAGS = ("script", "style", "nav", "header", "footer", "aside", "noscript")
+
+# Common job description container selectors, tried in order; each returns
+# the first matching element in document order
+_DESC_SELECTORS = tuple(
+    etree.XPath(f"(//{expr})[1]", namespaces={"re": "http://exslt.org/regular-expressions"})
+    for expr in (
+        # Workday
+        "*[@data-automation-id='jobPostingDescription']",
+        "*[re:test(@class, 'job[-_]?description', 'i')]",
+        "*[re:test(@class, 'posting[-_]?description', 'i')]",
+        # Generic
+        "*[@role='main']",
+        "*[@id='main']",
+        "*[contains(concat(' ', normalize-space(@class), ' '), ' main ')]",
+        "main",
+        "article",
+    )
+)
+
 
 def _parse_date_added(text: str) -> datetime:
     """
@@ -44,49 +131,45 @@ def _parse_date_added(text: str) -> datetime:
 
     Returns datetime in UTC.
     """
+    now = timezone.now()
     if not text:
-        return timezone.now()
+        return now
 
     text = text.lower().strip()
 
     # Remove "added" prefix
-    text = re.sub(r"^added\s+", "", text)
+    text = _RE_ADDED_PREFIX.sub("", text)
 
     # Handle relative dates
     if "today" in text:
-        return timezone.now()
+        return now
     if "yesterday" in text:
-        return timezone.now() - timedelta(days=1)
+        return now - timedelta(days=1)
 
-    days_match = re.search(r"(\d+)\s*days?\s*ago", text)
+    days_match = _RE_DAYS_AGO.search(text)
     if days_match:
         days = int(days_match.group(1))
-        return timezone.now() - timedelta(days=days)
+        return now - timedelta(days=days)
 
     # Handle absolute dates like "Dec 30" or "Jan 5"
-    month_day_match = re.search(r"([a-z]{3})\s+(\d{1,2})", text)
+    month_day_match = _RE_MONTH_DAY.search(text)
     if month_day_match:
         month_str = month_day_match.group(1)
         day = int(month_day_match.group(2))
 
-        months = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4,
-            "may": 5, "jun": 6, "jul": 7, "aug": 8,
-            "sep": 9, "oct": 10, "nov": 11, "dec": 12
-        }
-        month = months.get(month_str, 1)
-        year = timezone.now().year
+        month = _MONTHS.get(month_str, 1)
+        year = now.year
 
         # If the date is in the future, it's from last year
         try:
             parsed = datetime(year, month, day, tzinfo=dt_timezone.utc)
-            if parsed > timezone.now():
+            if parsed > now:
                 parsed = datetime(year - 1, month, day, tzinfo=dt_timezone.utc)
             return parsed
         except ValueError:
-            return timezone.now()
+            return now
 
-    return timezone.now()
+    return now
 
 
 def _parse_salary(text: str) -> tuple[Optional[float], Optional[float], str]:
@@ -99,7 +182,7 @@ def _parse_salary(text: str) -> tuple[Optional[float], Optional[float], str]:
         return None, None, "USD"
 
     # Find all dollar amounts
-    amounts = re.findall(r"\$?([\d,]+)", text)
+    amounts = _RE_SALARY_AMOUNTS.findall(text)
     amounts = [float(a.replace(",", "")) for a in amounts if a]
 
     if len(amounts) >= 2:
@@ -110,7 +193,49 @@ def _parse_salary(text: str) -> tuple[Optional[float], Optional[float], str]:
     return None, None, "USD"
 
 
-def _extract_job_from_card(card_elem, soup: BeautifulSoup) -> Optional[Dict]:
+def _element_text(elem, separator: str = "") -> str:
+    """Join the stripped, non-empty text fragments under an lxml element."""
+    return separator.join(text for text in (t.strip() for t in elem.itertext()) if text)
+
+
+class _CardScan(NamedTuple):
+    """Links and title found in one walk over a job card."""
+
+    job_href: str
+    title: str
+    org_name: str
+    external_urls: List[str]
+
+
+def _scan_card(card_elem) -> _CardScan:
+    """Collect the job link, title, organization and external links in one pass."""
+    job_href = ""
+    title = ""
+    org_name = ""
+    external_urls = []
+
+    for el in card_elem.iterdescendants("a", "h4", "h5"):
+        if el.tag != "a":
+            # The title is the first <h4> or <h5> tag
+            if not title:
+                title = _element_text(el)
+            continue
+
+        href = el.get("href", "")
+        if "/job-postings/" in href:
+            job_href = job_href or href
+        elif href and not org_name:
+            # Organization is the first other link that isn't a button
+            org_text = _element_text(el)
+            if org_text not in ["Job Details", "Apply", ""] and len(org_text) > 2:
+                org_name = org_text
+        if href.startswith("http") and "probablygood.org" not in href:
+            external_urls.append(href)
+
+    return _CardScan(job_href, title, org_name or "Unknown Organization", external_urls)
+
+
+def _extract_job_from_card(card_elem) -> Optional[Dict]:
     """
     Extract job data from a job card element.
 
@@ -132,12 +257,12 @@ def _extract_job_from_card(card_elem, soup: BeautifulSoup) -> Optional[Dict]:
     </div>
     """
     try:
+        scan = _scan_card(card_elem)
+
         # Find job URL from the job posting link
-        job_link = card_elem.find("a", href=lambda x: x and "/job-postings/" in x)
-        if not job_link:
+        job_url = scan.job_href
+        if not job_url:
             return None
-
-        job_url = job_link.get("href", "")
         if job_url.startswith("/"):
             job_url = urljoin(BASE_URL, job_url)
 
@@ -146,28 +271,15 @@ def _extract_job_from_card(card_elem, soup: BeautifulSoup) -> Optional[Dict]:
         if not external_id:
             return None
 
-        # Navigate to find title and org
-        # The title is in an <h4> or <h5> tag
-        title = ""
-        title_elem = card_elem.find(["h4", "h5"])
-        if title_elem:
-            title = title_elem.get_text(strip=True)
-
-        # Find organization name - look for links that aren't job posting links
-        org_name = "Unknown Organization"
-        for link in card_elem.find_all("a"):
-            href = link.get("href", "")
-            # Skip the job posting link and "Job Details" link
-            if "/job-postings/" in href or not href:
-                continue
-            org_text = link.get_text(strip=True)
-            # Skip common button texts
-            if org_text and org_text not in ["Job Details", "Apply", ""] and len(org_text) > 2:
-                org_name = org_text
-                break
+        title = scan.title
+        org_name = scan.org_name
 
         # Get all text content from card for metadata extraction
-        card_text = card_elem.get_text(" ", strip=True)
+        card_text = _element_text(card_elem, " ")
+        card_text_lower = card_text.lower()
+        # Map matches on the lowered text back to original case, unless
+        # lower() changed the length (a few non-ASCII characters do)
+        cased_text = card_text if len(card_text_lower) == len(card_text) else card_text_lower
 
         # Extract job details from card text
         location = "Remote"
@@ -177,24 +289,17 @@ def _extract_job_from_card(card_elem, soup: BeautifulSoup) -> Optional[Dict]:
         posted_at = timezone.now()
 
         # Look for location patterns
-        location_patterns = [
-            r"(Remote\s*[,\s]*[\w\s,]+(?:USA|UK|Canada|Germany|Australia|Netherlands|Uganda|India))",
-            r"([\w\s]+,\s*(?:USA|UK|Canada|Germany|Australia|Netherlands|Uganda|India))",
-            r"(Remote)",
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, card_text, re.IGNORECASE)
-            if match:
-                location = match.group(1).strip()
-                break
+        location_match = _RE_LOCATION.match(card_text_lower)
+        if location_match:
+            group = next(name for name, g in location_match.groupdict().items() if g is not None)
+            location = cased_text[location_match.start(group):location_match.end(group)].strip()
 
         # Look for "Added" date
-        added_match = re.search(r"Added\s*([A-Za-z]+\s+\d+|\d+\s*days?\s*ago|today|yesterday)", card_text, re.IGNORECASE)
+        added_match = _RE_ADDED_FULL.search(card_text_lower)
         if added_match:
             posted_at = _parse_date_added(added_match.group(0))
 
         # Look for job type
-        card_text_lower = card_text.lower()
         if "part-time" in card_text_lower or "part time" in card_text_lower:
             job_type = "part-time"
         elif "contract" in card_text_lower:
@@ -203,7 +308,7 @@ def _extract_job_from_card(card_elem, soup: BeautifulSoup) -> Optional[Dict]:
             job_type = "contract"  # Map internship to contract
 
         # Look for salary - numbers that look like salaries (5-6 digits)
-        salary_match = re.search(r"(\d{2,3}),?(\d{3})", card_text)
+        salary_match = _RE_SALARY_NUM.search(card_text)
         if salary_match:
             salary_str = salary_match.group(1) + salary_match.group(2)
             try:
@@ -216,10 +321,8 @@ def _extract_job_from_card(card_elem, soup: BeautifulSoup) -> Optional[Dict]:
 
         # Find external application URL if present
         application_url = job_url  # Default to Probably Good detail page
-        external_links = card_elem.find_all("a", href=lambda x: x and x.startswith("http") and "probablygood.org" not in x)
-        for link in external_links:
-            href = link.get("href", "")
-            if any(kw in href.lower() for kw in ["careers", "jobs", "workday", "greenhouse", "lever", "ashby", "apply"]):
+        for href in scan.external_urls:
+            if _RE_APPLY_KW.search(href):
                 application_url = href
                 break
 
@@ -254,6 +357,7 @@ def _extract_job_from_card(card_elem, soup: BeautifulSoup) -> Optional[Dict]:
         return None
 
 
+@functools.lru_cache(maxsize=512)
 def _fetch_greenhouse_description(url: str) -> str:
     """Fetch job description from Greenhouse API."""
     from ..crawlers.greenhouse import extract_greenhouse_info, fetch_greenhouse_job, parse_greenhouse_job
@@ -270,6 +374,7 @@ def _fetch_greenhouse_description(url: str) -> str:
     return parsed.get("description", "")
 
 
+@functools.lru_cache(maxsize=512)
 def _fetch_lever_description(url: str) -> str:
     """Fetch job description from Lever API."""
     from ..crawlers.lever import extract_lever_info, fetch_lever_job, parse_lever_job
@@ -289,6 +394,7 @@ def _fetch_lever_description(url: str) -> str:
     return desc
 
 
+@functools.lru_cache(maxsize=512)
 def _fetch_ashby_description(url: str) -> str:
     """Fetch job description from Ashby API."""
     from ..crawlers.ashby import extract_ashby_info, fetch_ashby_job, parse_ashby_job
@@ -305,6 +411,74 @@ def _fetch_ashby_description(url: str) -> str:
     return parsed.get("description", "")
 
 
+_MD_HEADINGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+_MD_EMPHASIS = {"strong": "**", "b": "**", "em": "*", "i": "*"}
+
+
+def _element_to_markdown(elem) -> str:
+    """
+    Render an lxml element as simple markdown straight from the tree.
+
+    Emits the same markup as crawlers.base.html_to_markdown (## headings,
+    **bold**, *italic*, bullet list items, paragraph and line breaks) without
+    serializing the element back to HTML first.
+    """
+    parts: List[str] = []
+    for event, el in etree.iterwalk(elem, events=("start", "end", "comment", "pi")):
+        tag = el.tag
+        if event == "start":
+            if tag in _MD_HEADINGS:
+                parts.append("\n## ")
+            elif tag in _MD_EMPHASIS:
+                parts.append(_MD_EMPHASIS[tag])
+            elif tag == "li":
+                parts.append("\n• ")
+            elif tag in ("p", "br"):
+                parts.append("\n")
+            if el.text:
+                parts.append(el.text)
+            continue
+
+        if event == "end":
+            if tag in _MD_HEADINGS:
+                parts.append("\n")
+            elif tag in _MD_EMPHASIS:
+                parts.append(_MD_EMPHASIS[tag])
+            elif tag == "p":
+                parts.append("\n")
+        # Comments and processing instructions contribute only their tail
+        if el is not elem and el.tail:
+            parts.append(el.tail)
+    return "".join(parts)
+
+
+def _read_capped(response: requests.Response, max_bytes: int) -> bytes:
+    """Read at most max_bytes of a streamed response body."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            break
+    return b"".join(chunks)[:max_bytes]
+
+
+# Known ATS hosts with API-backed description fetchers
+_API_FETCHERS = {
+    "boards.greenhouse.io": _fetch_greenhouse_description,
+    "job-boards.greenhouse.io": _fetch_greenhouse_description,
+    "jobs.lever.co": _fetch_lever_description,
+    "jobs.ashbyhq.com": _fetch_ashby_description,
+}
+# Substring fallback for hosts not listed above (e.g. custom subdomains)
+_API_FETCHER_DOMAINS = (
+    ("greenhouse.io", _fetch_greenhouse_description),
+    ("lever.co", _fetch_lever_description),
+    ("ashbyhq.com", _fetch_ashby_description),
+)
+
+
 def fetch_job_description(url: str, timeout: int = 30) -> str:
     """
     Fetch a job page and extract the main content as text.
@@ -323,85 +497,67 @@ def fetch_job_description(url: str, timeout: int = 30) -> str:
         return ""
 
     # Use API-based fetching for known platforms
-    try:
-        if "greenhouse.io" in url:
-            desc = _fetch_greenhouse_description(url)
-            if desc:
-                return desc
-
-        if "lever.co" in url:
-            desc = _fetch_lever_description(url)
-            if desc:
-                return desc
-
-        if "ashbyhq.com" in url:
-            desc = _fetch_ashby_description(url)
+    host = urlsplit(url).netloc.lower()
+    api_fetcher = _API_FETCHERS.get(host)
+    if api_fetcher is None:
+        api_fetcher = next(
+            (fetcher for domain, fetcher in _API_FETCHER_DOMAINS if domain in url), None
+        )
+    if api_fetcher is not None:
+        try:
+            desc = api_fetcher(url)
             if desc:
                 return desc
-    except Exception as e:
-        logger.warning(f"API fetch failed for {url}: {e}")
+        except Exception as e:
+            logger.warning(f"API fetch failed for {url}: {e}")
 
     # For other sites, try basic HTML scraping
     # Note: Many modern sites use JavaScript rendering and won't work
     try:
-        response = requests.get(url, headers=FETCH_HEADERS, timeout=timeout)
-        response.raise_for_status()
+        with _SESSION.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            content = _read_capped(response, MAX_HTML_BYTES)
     except requests.RequestException as e:
         logger.warning(f"Failed to fetch {url}: {e}")
         return ""
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    try:
+        root = lxml_html.fromstring(content)
+    except (etree.ParserError, ValueError):
+        return ""
 
     # Check if page requires JavaScript
-    body_text = soup.find("body")
-    if body_text:
-        body_content = body_text.get_text(strip=True)
+    body = next(root.iter("body"), None)
+    if body is not None:
+        body_content = "".join(text.strip() for text in body.itertext())
         if "enable JavaScript" in body_content or len(body_content) < 100:
             logger.debug(f"Page requires JavaScript: {url}")
             return ""
 
-    # Remove script, style, nav, header, footer elements
-    for tag in soup.find_all(["script", "style", "nav", "header", "footer", "aside", "noscript"]):
-        tag.decompose()
+    # Remove script, style, nav, header, footer elements in one C-level pass
+    etree.strip_elements(root, *_STRIP_TAGS, with_tail=False)
 
     # Try to find the main job content using common selectors
     content = None
 
-    # Common job description container selectors
-    selectors = [
-        # Workday
-        {"data-automation-id": "jobPostingDescription"},
-        {"class_": re.compile(r"job[-_]?description", re.I)},
-        {"class_": re.compile(r"posting[-_]?description", re.I)},
-        # Generic
-        {"role": "main"},
-        {"id": "main"},
-        {"class_": "main"},
-        {"tag": "main"},
-        {"tag": "article"},
-    ]
-
-    for selector in selectors:
-        if "tag" in selector:
-            content = soup.find(selector["tag"])
-        else:
-            content = soup.find(attrs=selector)
-        if content:
+    for selector in _DESC_SELECTORS:
+        matches = selector(root)
+        if matches:
+            content = matches[0]
             break
 
     # Fallback to body if no specific container found
-    if not content:
-        content = soup.find("body")
+    if content is None:
+        content = body
 
-    if not content:
+    if content is None:
         return ""
 
     # Convert to markdown-style text
-    html_content = str(content)
-    text = html_to_markdown(html_content)
+    text = _element_to_markdown(content)
 
     # Clean up: remove excessive whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _RE_WS.sub("\n\n", text)
     text = text.strip()
 
     # Limit to reasonable length (first ~8000 chars for AI processing)
@@ -419,39 +575,51 @@ def fetch_descriptions_batch(
     """
     Fetch job descriptions for a batch of job payloads.
 
+    Descriptions are fetched concurrently; requests to the same host are
+    capped at DESCRIPTION_PER_HOST_CONCURRENCY and spaced by `delay`.
+
     Args:
         payloads: List of job payload dicts with application_url
-        delay: Delay between requests in seconds
+        delay: Delay between requests to the same host in seconds
         progress_callback: Optional callback(completed, total)
 
     Returns:
         Updated payloads with descriptions filled in
     """
     total = len(payloads)
-    updated_payloads = []
+    updated_payloads = list(payloads)
+    host_locks = {
+        urlsplit(payload.get("application_url", "")).netloc: threading.Semaphore(
+            DESCRIPTION_PER_HOST_CONCURRENCY
+        )
+        for payload in payloads
+    }
 
-    for i, payload in enumerate(payloads):
+    def fetch_one(payload: Dict) -> Dict:
         url = payload.get("application_url", "")
+        if not url or "probablygood.org" in url:
+            return payload
 
-        if url and "probablygood.org" not in url:
+        with host_locks[urlsplit(url).netloc]:
             logger.debug(f"Fetching description from: {url}")
             description = fetch_job_description(url)
+            # Rate limiting between requests to the same host
+            time.sleep(delay)
 
-            if description:
-                payload = payload.copy()
-                payload["description"] = description
-                logger.debug(f"  Got {len(description)} chars for '{payload.get('title', 'Unknown')}'")
-            else:
-                logger.debug(f"  No description extracted for '{payload.get('title', 'Unknown')}'")
-
-        updated_payloads.append(payload)
-
-        if progress_callback:
-            progress_callback(i + 1, total)
+        if description:
+            payload = payload.copy()
+            payload["description"] = description
+            logger.debug(f"  Got {len(description)} chars for '{payload.get('title', 'Unknown')}'")
+        else:
+            logger.debug(f"  No description extracted for '{payload.get('title', 'Unknown')}'")
+        return payload
 
-        # Rate limiting between requests
-        if i < total - 1:
-            time.sleep(delay)
+    with ThreadPoolExecutor(max_workers=DESCRIPTION_MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch_one, payload): i for i, payload in enumerate(payloads)}
+        for completed, future in enumerate(as_completed(futures), start=1):
+            updated_payloads[futures[future]] = future.result()
+            if progress_callback:
+                progress_callback(completed, total)
 
     return updated_payloads
 
@@ -471,6 +639,7 @@ def fetch_job_listings(
         List of job payload dicts
     """
     jobs = []
+    seen_external_ids: set[str] = set()
     page = 1
 
     headers = {
@@ -491,23 +660,28 @@ def fetch_job_listings(
         logger.info(f"Fetching page {page}: {url}")
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _SESSION.get(url, headers=headers, timeout=30)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Failed to fetch page {page}: {e}")
             break
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        try:
+            root = lxml_html.fromstring(response.content)
+        except (etree.ParserError, ValueError):
+            logger.info(f"Empty page {page}, stopping")
+            break
 
         # Find job cards - look for elements containing job posting links
         # The exact structure depends on Webflow's output
-        job_links = soup.find_all("a", href=lambda x: x and "/job-postings/" in x)
+        job_links = root.xpath("//a[contains(@href, '/job-postings/')]")
 
         if not job_links:
             logger.info(f"No more jobs found on page {page}")
             break
 
         # Group links by their parent containers to get job cards
+        card_containers = set(_CARD_CONTAINERS(root))
         seen_urls = set()
         page_jobs = []
 
@@ -520,26 +694,26 @@ def fetch_job_listings(
             # Find the parent card element (walk up to find a reasonable container)
             card = link
             for _ in range(5):  # Walk up max 5 levels
-                parent = card.parent
-                if parent and parent.name in ["div", "article", "li", "section"]:
+                parent = card.getparent()
+                if parent is not None and parent.tag in ["div", "article", "li", "section"]:
                     # Check if this parent contains more job-related content
-                    parent_text = parent.get_text()
-                    if "Added" in parent_text or "$" in parent_text:
+                    if parent in card_containers:
                         card = parent
                         break
                     card = parent
                 else:
                     break
 
-            job_data = _extract_job_from_card(card, soup)
-            if job_data and job_data["external_id"] not in [j["external_id"] for j in jobs]:
+            job_data = _extract_job_from_card(card)
+            if job_data and job_data["external_id"] not in seen_external_ids:
+                seen_external_ids.add(job_data["external_id"])
                 page_jobs.append(job_data)
 
         jobs.extend(page_jobs)
         logger.info(f"Page {page}: Found {len(page_jobs)} jobs (total: {len(jobs)})")
 
         # Check for next page
-        next_link = soup.find("a", href=lambda x: x and f"{PAGE_PARAM}={page + 1}" in x)
+        next_link = root.xpath(f"//a[contains(@href, '{PAGE_PARAM}={page + 1}')]")
         if not next_link:
             logger.info(f"No next page link found, stopping at page {page}")
             break
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone as dt_timezone
 from typing import Callable, Dict, Optional, Tuple
 
-import requests
+import httpx
 from django.conf import settings
 from django.utils import timezone
 
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 API_URL = "https://api.reliefweb.int/v2/jobs"
 PAGE_SIZE = 100
 REMOTE_QUERY = "(remote) AND NOT _exists_:country"
+# Concurrent list page requests once totalCount is known
+MAX_CONCURRENT_PAGES = 8
 
 
 def _reliefweb_headers(app_name: str) -> Dict[str, str]:
@@ -29,7 +32,8 @@ def _parse_iso_date(value: Optional[str]) -> datetime:
     if not value:
         return timezone.now()
     try:
-        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        # Python 3.11+ parses a trailing "Z" directly
+        parsed = datetime.fromisoformat(value)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=dt_timezone.utc)
         return parsed
@@ -38,20 +42,21 @@ def _parse_iso_date(value: Optional[str]) -> datetime:
         return timezone.now()
 
 
-def _fetch_reliefweb_list(
-    app_name: str, offset: int, headers: Dict[str, str]
+async def _fetch_reliefweb_list(
+    client: httpx.AsyncClient, app_name: str, offset: int
 ) -> Tuple[list, Optional[int]]:
     params = {
         "appname": app_name,
-        "profile": "list",
+        # Full profile returns body, sources and dates inline, so no
+        # per-job detail request is needed
+        "profile": "full",
         "preset": "latest",
-        "slim": 1,
         "query[value]": REMOTE_QUERY,
         "query[operator]": "AND",
         "limit": PAGE_SIZE,
         "offset": offset,
     }
-    response = requests.get(API_URL, params=params, headers=headers, timeout=30)
+    response = await client.get(API_URL, params=params)
     response.raise_for_status()
     data = response.json()
     items = data.get("data", [])
@@ -59,23 +64,6 @@ def _fetch_reliefweb_list(
     return items, total_count
 
 
-def _fetch_reliefweb_detail(
-    job_id: str, app_name: str, headers: Dict[str, str]
-) -> Optional[Dict]:
-    params = {"appname": app_name}
-    try:
-        response = requests.get(
-            f"{API_URL}/{job_id}", params=params, headers=headers, timeout=30
-        )
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        logger.warning("ReliefWeb job %s fetch failed: %s, skipping", job_id, e)
-        return None
-    data = response.json()
-    items = data.get("data") or []
-    return items[0] if items else None
-
-
 def _transform_reliefweb_item(item: Dict) -> Dict:
     fields = item.get("fields", {})
     title = fields.get("title") or "Untitled role"
@@ -160,29 +148,34 @@ async def import_reliefweb(
     app_name = settings.RELIEFWEB_APP_NAME
     headers = _reliefweb_headers(app_name)
 
-    # Collect all job payloads first
-    all_payloads = []
-    offset = 0
-
-    while True:
-        list_items, total_count = _fetch_reliefweb_list(app_name, offset, headers)
-        if not list_items:
-            break
-
-        for item in list_items:
-            detail = _fetch_reliefweb_detail(str(item.get("id")), app_name, headers)
-            if not detail:
-                continue
-            job_payload = _transform_reliefweb_item(detail)
-            all_payloads.append(job_payload)
-            if limit and len(all_payloads) >= limit:
-                break
-
-        offset += PAGE_SIZE
-        if total_count is not None and offset >= total_count:
-            break
-        if limit and len(all_payloads) >= limit:
-            break
+    async with httpx.AsyncClient(http2=True, headers=headers, timeout=30) as client:
+        # First page tells us how many pages there are
+        items, total_count = await _fetch_reliefweb_list(client, app_name, 0)
+        pages = [items]
+
+        if items and total_count is not None:
+            stop = min(total_count, limit) if limit else total_count
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+            async def fetch_items(offset: int) -> list:
+                async with semaphore:
+                    page_items, _ = await _fetch_reliefweb_list(client, app_name, offset)
+                    return page_items
+
+            pages += await asyncio.gather(
+                *(fetch_items(offset) for offset in range(PAGE_SIZE, stop, PAGE_SIZE))
+            )
+        else:
+            # No total to plan from: page serially until an empty page
+            offset = PAGE_SIZE
+            while items and not (limit and offset >= limit):
+                items, _ = await _fetch_reliefweb_list(client, app_name, offset)
+                pages.append(items)
+                offset += PAGE_SIZE
+
+    all_payloads = [_transform_reliefweb_item(item) for page in pages for item in page]
+    if limit:
+        all_payloads = all_payloads[:limit]
 
     if dry_run:
         return {"fetched": len(all_payloads), "created": 0, "updated": 0}
@@ -6,14 +6,20 @@ Source: https://docs.google.com/spreadsheets/d/1dFVoF6f9VU5pjaGhyyvQaBN0n6ae-iLC
 """
 
 import csv
+import functools
 import io
 import logging
+import re
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Optional
-from urllib.parse import urlparse
 
 import requests
 from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +28,32 @@ SHEET_ID = "1dFVoF6f9VU5pjaGhyyvQaBN0n6ae-iLCtlvsO1N2jhA"
 SHEET_GID = "0"
 CSV_URL = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv&gid={SHEET_GID}"
 
-CACHE_KEY = "job_boards_list"
+# Shared session so refetches reuse the pooled Sheets connection; retries
+# cover Sheets 429 quota responses and transient 5xx errors
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# First cell text of the sheet's column header row
+HEADER_NEEDLE = "List / Site / Job Source"
+
+CACHE_KEY = "job_boards_bundle"
 CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
+# Entries outlive their freshness window so stale boards can be served while
+# a background thread refetches the sheet
+CACHE_STALE_TIMEOUT = CACHE_TIMEOUT * 2
+REFRESH_LOCK_KEY = "job_boards_refresh_lock"
+REFRESH_LOCK_TIMEOUT = 60 * 5  # one refresh attempt per 5 minutes
 
 # Attribution info
 MAINTAINERS = {
@@ -35,56 +65,99 @@ MAINTAINERS = {
     ],
 }
 
+# Keyword rules in priority order: the first category with a keyword in the
+# board's name or notes wins
+_CATEGORY_KEYWORDS = (
+    ("Climate", ("climate", "environment", "green", "clean energy", "terra.do")),
+    ("EA", ("effective altruism", "80,000 hours", "80000", "ea job", "probably good")),
+    ("Tech", ("tech for good", "responsible tech", "civic tech", "tech jobs for good", "digital rights", "foss", "open source")),
+    ("Government", ("government", "policy", "usajobs", "progressive", "democracy", "political", "campaign")),
+    ("Media", ("journalism", "media", "newsroom", "news")),
+    ("Nonprofit", ("nonprofit", "ngo", "charity", "philanthropy", "foundation", "idealist", "social impact")),
+    ("Development", ("development", "humanitarian", "relief", "un ", "global health")),
+    ("Design", ("design", "creative", "ux", "ui")),
+    ("Startups", ("startup", "angel", "unicorn", "venture")),
+)
+
+
+def _first_rule_pattern(rules, flags: int = 0) -> re.Pattern:
+    """
+    Compile (name, regex) rules into one anchored pattern.
+
+    Each rule's alternative is tried across the whole text before the next
+    one, so `pattern.match(text).lastgroup` names the first rule (in order)
+    that matches anywhere in the text. A failed alternative rescans from the
+    start, so a miss still costs one pass per rule, as the any() chain did;
+    the saving is doing those passes inside the regex engine.
+    """
+    return re.compile("|".join(f".*?(?P<{name}>{regex})" for name, regex in rules), re.DOTALL | flags)
+
+
+# Matched against "name\0notes"
+_CATEGORY_RE = _first_rule_pattern(
+    (category, "|".join(map(re.escape, keywords))) for category, keywords in _CATEGORY_KEYWORDS
+)
+
+# http(s) scheme followed by a host; no whitespace anywhere
+_URL_RE = re.compile(r"https?://[^\s/]\S*\Z")
+
+# Fallback category from geography when no keyword matched
+_GEO_CATEGORY_RE = _first_rule_pattern(
+    (
+        ("UK", r"uk"),
+        ("US", r"us|america"),
+    ),
+    re.IGNORECASE,
+)
+
+# Tag rules in priority order; named groups are the tags
+_GEO_TAG_RE = _first_rule_pattern(
+    (
+        ("Global", r"global|international"),
+        ("UK", r"\buk\b"),
+        ("US", r"\bus"),  # us, usa, us-based; not "australia"
+        ("Europe", r"europe"),
+        ("Australia", r"australia"),
+        ("Remote", r"remote"),
+    ),
+    re.IGNORECASE,
+)
+_TYPE_TAG_RE = _first_rule_pattern(
+    (
+        ("Newsletter", r"newsletter"),
+        ("Community", r"facebook|google group"),
+        ("Slack", r"slack"),
+    ),
+    re.IGNORECASE,
+)
+_NOTES_TAG_RE = _first_rule_pattern(
+    (
+        ("Climate", r"climate"),
+        ("Tech", r"tech"),
+        ("Nonprofit", r"nonprofit"),
+        ("Media", r"journalism"),
+        ("Design", r"design"),
+        ("Fundraising", r"fundraising"),
+        ("Startups", r"startup"),
+        ("Remote", r"remote"),
+    ),
+    re.IGNORECASE,
+)
+
 
 def categorize_board(name: str, url: str, board_type: str, geography: str, notes: str) -> str:
     """Categorize a job board based on its attributes."""
     name_lower = name.lower()
     notes_lower = notes.lower() if notes else ""
-    type_lower = board_type.lower() if board_type else ""
-
-    # Climate & Environment
-    if any(kw in name_lower or kw in notes_lower for kw in ["climate", "environment", "green", "clean energy", "terra.do"]):
-        return "Climate"
-
-    # Effective Altruism
-    if any(kw in name_lower or kw in notes_lower for kw in ["effective altruism", "80,000 hours", "80000", "ea job", "probably good"]):
-        return "EA"
-
-    # Tech for Good
-    if any(kw in name_lower or kw in notes_lower for kw in ["tech for good", "responsible tech", "civic tech", "tech jobs for good", "digital rights", "foss", "open source"]):
-        return "Tech"
-
-    # Government & Policy
-    if any(kw in name_lower or kw in notes_lower for kw in ["government", "policy", "usajobs", "progressive", "democracy", "political", "campaign"]):
-        return "Government"
-
-    # Journalism & Media
-    if any(kw in name_lower or kw in notes_lower for kw in ["journalism", "media", "newsroom", "news"]):
-        return "Media"
-
-    # Nonprofit & NGO
-    if any(kw in name_lower or kw in notes_lower for kw in ["nonprofit", "ngo", "charity", "philanthropy", "foundation", "idealist", "social impact"]):
-        return "Nonprofit"
-
-    # International Development
-    if any(kw in name_lower or kw in notes_lower for kw in ["development", "humanitarian", "relief", "un ", "global health"]):
-        return "Development"
 
-    # Design & Creative
-    if any(kw in name_lower or kw in notes_lower for kw in ["design", "creative", "ux", "ui"]):
-        return "Design"
-
-    # Startups & Innovation
-    if any(kw in name_lower or kw in notes_lower for kw in ["startup", "angel", "unicorn", "venture"]):
-        return "Startups"
+    match = _CATEGORY_RE.match(f"{name_lower}\x00{notes_lower}")
+    if match:
+        return match.lastgroup
 
     # Default based on geography
-    if geography:
-        geo_lower = geography.lower()
-        if "uk" in geo_lower:
-            return "UK"
-        elif "us" in geo_lower or "america" in geo_lower:
-            return "US"
+    match = _GEO_CATEGORY_RE.match(geography or "")
+    if match:
+        return match.lastgroup
 
     return "General"
 
@@ -94,137 +167,122 @@ def extract_tags(name: str, board_type: str, geography: str, notes: str) -> list
     tags = []
 
     # Add geography tag
-    if geography:
-        geo_lower = geography.lower()
-        if "global" in geo_lower or "international" in geo_lower:
-            tags.append("Global")
-        elif "uk" in geo_lower:
-            tags.append("UK")
-        elif "us" in geo_lower:
-            tags.append("US")
-        elif "europe" in geo_lower:
-            tags.append("Europe")
-        elif "australia" in geo_lower:
-            tags.append("Australia")
-        elif "remote" in geo_lower:
-            tags.append("Remote")
+    match = _GEO_TAG_RE.match(geography or "")
+    if match:
+        tags.append(match.lastgroup)
 
     # Add type tag
-    if board_type:
-        type_lower = board_type.lower()
-        if "newsletter" in type_lower:
-            tags.append("Newsletter")
-        elif "facebook" in type_lower or "google group" in type_lower:
-            tags.append("Community")
-        elif "slack" in type_lower:
-            tags.append("Slack")
-
-    # Extract topic tags from notes
-    if notes:
-        notes_lower = notes.lower()
-        topic_keywords = {
-            "climate": "Climate",
-            "tech": "Tech",
-            "nonprofit": "Nonprofit",
-            "journalism": "Media",
-            "design": "Design",
-            "fundraising": "Fundraising",
-            "startup": "Startups",
-            "remote": "Remote",
-        }
-        for keyword, tag in topic_keywords.items():
-            if keyword in notes_lower and tag not in tags:
-                tags.append(tag)
-                break  # Only add one topic tag
+    match = _TYPE_TAG_RE.match(board_type or "")
+    if match:
+        tags.append(match.lastgroup)
+
+    # Extract topic tag from notes (only one; Remote may already be present)
+    match = _NOTES_TAG_RE.match(notes or "")
+    if match and match.lastgroup not in tags:
+        tags.append(match.lastgroup)
 
     return tags[:3]  # Limit to 3 tags
 
 
+@functools.lru_cache(maxsize=4096)
+def _classify_board(name: str, board_type: str, geography: str, notes: str) -> tuple[str, tuple]:
+    """
+    Category and tags for a board row, memoized so refreshes of an
+    unchanged sheet skip the classification work.
+    """
+    category = categorize_board(name, "", board_type, geography, notes)
+    return category, tuple(extract_tags(name, board_type, geography, notes))
+
+
 def is_valid_url(url: str) -> bool:
     """Check if URL is valid and accessible."""
-    if not url or not url.startswith("http"):
-        return False
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    return bool(url) and _URL_RE.match(url) is not None
+
+
+def _parse_board_row(row: list, seen_urls: set) -> Optional[dict]:
+    """Build a job board entry from a sheet row, or None if it should be skipped."""
+    if len(row) < 3:
+        return None
+
+    # CSV columns: empty, Name, URL, Type, Geography, Notes, ...
+    name = row[1].strip() if len(row) > 1 else ""
+    url = row[2].strip() if len(row) > 2 else ""
+    board_type = row[3].strip() if len(row) > 3 else ""
+    geography = row[4].strip() if len(row) > 4 else ""
+    notes = row[5].strip() if len(row) > 5 else ""
+
+    # Skip invalid entries
+    if not name or not is_valid_url(url):
+        return None
+
+    # Skip duplicates
+    if url in seen_urls:
+        return None
+    seen_urls.add(url)
+
+    # Skip entries that are just lists of lists or meta-resources
+    if "list of" in name.lower() and "job board" in name.lower():
+        return None
+
+    # Create board entry
+    category, tags = _classify_board(name, board_type, geography, notes)
+
+    # Use notes as description, or create one from type/geography
+    description = notes if notes else f"{board_type} - {geography}" if board_type else ""
+    if len(description) > 200:
+        description = description[:197] + "..."
+
+    return {
+        "name": name,
+        "url": url,
+        "description": description,
+        "tags": list(tags),
+        "category": category,
+        "type": board_type,
+        "geography": geography,
+    }
 
 
 def fetch_job_boards_from_sheet() -> list:
     """Fetch job boards from Google Sheet CSV."""
     try:
-        response = requests.get(CSV_URL, timeout=15)
-        response.raise_for_status()
-
-        # Parse CSV
-        content = response.content.decode("utf-8")
-        reader = csv.reader(io.StringIO(content))
-        rows = list(reader)
-
-        # Skip header rows (first few rows contain maintainer info)
-        # Find the header row with "List / Site / Job Source"
-        header_idx = None
-        for i, row in enumerate(rows):
-            if len(row) > 1 and "List / Site / Job Source" in str(row):
-                header_idx = i
-                break
-
-        if header_idx is None:
-            # Try to find by column content
-            for i, row in enumerate(rows):
-                if len(row) > 2 and row[1] and "http" in str(row[2]):
-                    header_idx = i - 1
-                    break
-
-        if header_idx is None:
-            header_idx = 3  # Default fallback
-
-        job_boards = []
-        seen_urls = set()
-
-        for row in rows[header_idx + 1:]:
-            if len(row) < 3:
-                continue
-
-            # CSV columns: empty, Name, URL, Type, Geography, Notes, ...
-            name = row[1].strip() if len(row) > 1 else ""
-            url = row[2].strip() if len(row) > 2 else ""
-            board_type = row[3].strip() if len(row) > 3 else ""
-            geography = row[4].strip() if len(row) > 4 else ""
-            notes = row[5].strip() if len(row) > 5 else ""
-
-            # Skip invalid entries
-            if not name or not is_valid_url(url):
-                continue
-
-            # Skip duplicates
-            if url in seen_urls:
-                continue
-            seen_urls.add(url)
-
-            # Skip entries that are just lists of lists or meta-resources
-            if "list of" in name.lower() and "job board" in name.lower():
-                continue
-
-            # Create board entry
-            category = categorize_board(name, url, board_type, geography, notes)
-            tags = extract_tags(name, board_type, geography, notes)
-
-            # Use notes as description, or create one from type/geography
-            description = notes if notes else f"{board_type} - {geography}" if board_type else ""
-            if len(description) > 200:
-                description = description[:197] + "..."
-
-            job_boards.append({
-                "name": name,
-                "url": url,
-                "description": description,
-                "tags": tags,
-                "category": category,
-                "type": board_type,
-                "geography": geography,
-            })
+        with _SESSION.get(CSV_URL, timeout=15, stream=True) as response:
+            response.raise_for_status()
+
+            # Parse CSV as it streams in; newline="" keeps quoted multi-line
+            # notes intact
+            response.raw.decode_content = True
+            reader = csv.reader(io.TextIOWrapper(response.raw, encoding="utf-8", newline=""))
+
+            job_boards = []
+            seen_urls = set()
+
+            # Skip header rows (first few rows contain maintainer info)
+            # until the header row with "List / Site / Job Source"; only
+            # those preamble rows are held in memory
+            preamble = []
+            header_found = False
+            for row in reader:
+                if header_found:
+                    board = _parse_board_row(row, seen_urls)
+                    if board:
+                        job_boards.append(board)
+                elif len(row) > 1 and any(HEADER_NEEDLE in cell for cell in row):
+                    header_found = True
+                    preamble.clear()
+                else:
+                    preamble.append(row)
+
+        if not header_found:
+            # Try to find the first data row by column content
+            start = next(
+                (i for i, row in enumerate(preamble) if len(row) > 2 and row[1] and "http" in row[2]),
+                4,  # Default fallback: data starts after four preamble rows
+            )
+            for row in preamble[start:]:
+                board = _parse_board_row(row, seen_urls)
+                if board:
+                    job_boards.append(board)
 
         return job_boards
 
@@ -233,15 +291,45 @@ def fetch_job_boards_from_sheet() -> list:
         return []
 
 
-def get_job_boards() -> tuple[list, dict]:
+def _build_bundle(job_boards: list) -> dict:
+    # Categories only depend on the boards, so compute them once per fetch
+    return {
+        "boards": job_boards,
+        "categories": get_job_board_categories(job_boards),
+        "refresh_after": time.time() + CACHE_TIMEOUT,
+    }
+
+
+def _refresh_job_boards() -> None:
+    """Refetch the sheet and replace the cached bundle if the fetch succeeds."""
+    try:
+        job_boards = fetch_job_boards_from_sheet()
+        if job_boards:
+            cache.set(CACHE_KEY, _build_bundle(job_boards), CACHE_STALE_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Background job boards refresh failed: {e}")
+
+
+def get_job_boards_bundle() -> dict:
     """
-    Get job boards list with caching.
-    Returns tuple of (job_boards, maintainer_info).
+    Get job boards together with their derived category counts, with caching.
+    Returns dict with "boards", "categories" and "maintainers".
+
+    Once an entry is past its refresh time it is still returned, and a single
+    background refresh is started so requests never wait on the sheet.
     """
     # Try cache first
     cached = cache.get(CACHE_KEY)
     if cached:
-        return cached, MAINTAINERS
+        if time.time() >= cached["refresh_after"] and cache.add(
+            REFRESH_LOCK_KEY, True, REFRESH_LOCK_TIMEOUT
+        ):
+            threading.Thread(target=_refresh_job_boards, daemon=True).start()
+        return {
+            "boards": cached["boards"],
+            "categories": cached["categories"],
+            "maintainers": MAINTAINERS,
+        }
 
     # Fetch from Google Sheet
     job_boards = fetch_job_boards_from_sheet()
@@ -250,19 +338,31 @@ def get_job_boards() -> tuple[list, dict]:
     if not job_boards:
         job_boards = get_fallback_job_boards()
 
+    bundle = _build_bundle(job_boards)
+
     # Cache the result
     if job_boards:
-        cache.set(CACHE_KEY, job_boards, CACHE_TIMEOUT)
+        cache.set(CACHE_KEY, bundle, CACHE_STALE_TIMEOUT)
+
+    return {
+        "boards": bundle["boards"],
+        "categories": bundle["categories"],
+        "maintainers": MAINTAINERS,
+    }
+
 
-    return job_boards, MAINTAINERS
+def get_job_boards() -> tuple[list, dict]:
+    """
+    Get job boards list with caching.
+    Returns tuple of (job_boards, maintainer_info).
+    """
+    bundle = get_job_boards_bundle()
+    return bundle["boards"], bundle["maintainers"]
 
 
 def get_job_board_categories(job_boards: list) -> list:
     """Generate category list with counts from job boards."""
-    category_counts = {}
-    for board in job_boards:
-        cat = board.get("category", "General")
-        category_counts[cat] = category_counts.get(cat, 0) + 1
+    category_counts = Counter(board.get("category", "General") for board in job_boards)
 
     # Define category display order and names
     category_info = {
@@ -283,7 +383,7 @@ def get_job_board_categories(job_boards: list) -> list:
     categories = [{"id": "all", "name": "All Boards", "count": len(job_boards)}]
 
     for cat_id, cat_name in category_info.items():
-        count = category_counts.get(cat_id, 0)
+        count = category_counts[cat_id]
         if count > 0:
             categories.append({"id": cat_id, "name": cat_name, "count": count})
 
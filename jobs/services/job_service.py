@@ -1,7 +1,58 @@
+import hashlib
+import json
+import operator
+import time
+from functools import reduce
+
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import caches
 from django.db.models import Q
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from django.utils import timezone
 from ..models import Job, Category, SavedJob, Organization
+from ..utils import unique_slug
+
+# Query parameters that affect get_filtered_jobs results
+FILTER_KEYS = (
+    "category",
+    "type",
+    "organization",
+    "country",
+    "city",
+    "salary_min",
+    "experience",
+    "education",
+    "skillset",
+    "q",
+)
+
+# Filtered listings cache the matching job ids; keys embed a version that
+# Job/Organization/Category saves and deletes bump (see jobs.signals). The
+# on-disk "listings" cache is shared by the web workers and the import cron,
+# so a bump from either invalidates every process.
+FILTERED_JOBS_CACHE_ALIAS = "listings"
+FILTERED_JOBS_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+FILTERED_JOBS_VERSION_KEY = "jobs:filtered:version"
+# Broader searches aren't cached: materializing their ids and sending them
+# back as a huge IN (...) list costs more than re-running the filter
+FILTERED_JOBS_MAX_CACHED_IDS = 500
+
+# Columns rendered by the listing cards (jobs/job_list.html); the long text
+# fields are only needed on the detail page
+LISTING_FIELDS = (
+    "title",
+    "slug",
+    "job_type",
+    "location",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "is_featured",
+    "posted_at",
+    "organization__name",
+    "organization__logo",
+    "category__name",
+)
 
 
 class JobService:
@@ -9,7 +60,58 @@ class JobService:
     def get_filtered_jobs(filters: dict):
         """
         Filter jobs based on query parameters.
+
+        Ids matching a filter combination are cached, so repeat searches skip
+        the text predicates and only fetch the rows by primary key. Searches
+        matching more than FILTERED_JOBS_MAX_CACHED_IDS jobs run uncached.
         """
+        canonical = {key: filters.get(key) for key in FILTER_KEYS if filters.get(key)}
+        if not canonical:
+            # Unfiltered listing is already a simple indexed query
+            return JobService._filter_jobs(canonical).only(*LISTING_FIELDS)
+
+        cache = caches[FILTERED_JOBS_CACHE_ALIAS]
+        version = cache.get_or_set(FILTERED_JOBS_VERSION_KEY, time.time_ns, None)
+        digest = hashlib.blake2b(
+            json.dumps(canonical, sort_keys=True).encode(), digest_size=16
+        ).hexdigest()
+        cache_key = f"jobs:filtered:{version}:{digest}"
+
+        job_ids = cache.get(cache_key)
+        if job_ids is None:
+            job_ids = list(
+                JobService._filter_jobs(canonical).values_list("id", flat=True)[
+                    : FILTERED_JOBS_MAX_CACHED_IDS + 1
+                ]
+            )
+            if len(job_ids) > FILTERED_JOBS_MAX_CACHED_IDS:
+                job_ids = False  # Too broad; remembered so repeats skip the probe
+            cache.set(cache_key, job_ids, FILTERED_JOBS_CACHE_TIMEOUT)
+
+        if job_ids is False:
+            return JobService._filter_jobs(canonical).only(*LISTING_FIELDS)
+
+        # is_active is re-checked: bulk deactivations (cleanup_jobs) use
+        # queryset.update(), which doesn't bump the version
+        return (
+            Job.objects.filter(is_active=True, id__in=job_ids)
+            .select_related("organization", "category")
+            .only(*LISTING_FIELDS)
+            .order_by("-is_featured", "-posted_at")
+        )
+
+    @staticmethod
+    def invalidate_filtered_jobs():
+        """Bump the cache version so every cached filtered listing is ignored."""
+        cache = caches[FILTERED_JOBS_CACHE_ALIAS]
+        try:
+            cache.incr(FILTERED_JOBS_VERSION_KEY)
+        except ValueError:
+            # Version key expired or evicted: start from a fresh, unused value
+            cache.set(FILTERED_JOBS_VERSION_KEY, time.time_ns(), None)
+
+    @staticmethod
+    def _filter_jobs(filters: dict):
         jobs = Job.objects.filter(is_active=True).select_related(
             "organization", "category"
         )
@@ -40,27 +142,56 @@ class JobService:
             except (TypeError, ValueError):
                 pass
 
-        # Text search (description/requirements)
-        if expr := filters.get("experience"):
-            jobs = jobs.filter(
-                Q(description__icontains=expr) | Q(requirements__icontains=expr)
+        # Text search (experience/education/skillset): every term must match,
+        # combined into one full-text predicate on the indexed search_vector.
+        # The vector also covers title and impact, so these filters match a
+        # little wider than the description/requirements substring fallback
+        # used for jobs without a vector.
+        terms = [
+            term
+            for term in (
+                filters.get("experience"),
+                filters.get("education"),
+                filters.get("skillset"),
             )
-        if edu := filters.get("education"):
+            if term
+        ]
+        if terms:
             jobs = jobs.filter(
-                Q(description__icontains=edu) | Q(requirements__icontains=edu)
-            )
-        if skill := filters.get("skillset"):
-            jobs = jobs.filter(
-                Q(description__icontains=skill) | Q(requirements__icontains=skill)
+                Q(
+                    search_vector=reduce(
+                        operator.and_,
+                        (SearchQuery(term, search_type="websearch") for term in terms),
+                    )
+                )
+                | (
+                    Q(search_vector__isnull=True)
+                    & reduce(
+                        operator.and_,
+                        (
+                            Q(description__icontains=term) | Q(requirements__icontains=term)
+                            for term in terms
+                        ),
+                    )
+                )
             )
 
-        # Core Search
+        # Core Search: full-text match on the GIN-indexed search_vector
+        # (title, description, requirements, impact). Organization names are
+        # not in the vector, and jobs whose vector hasn't been populated yet
+        # fall back to substring matching.
         if query := filters.get("q"):
             jobs = jobs.filter(
-                Q(title__icontains=query)
-                | Q(description__icontains=query)
-                | Q(requirements__icontains=query)
+                Q(search_vector=SearchQuery(query, search_type="websearch"))
                 | Q(organization__name__icontains=query)
+                | (
+                    Q(search_vector__isnull=True)
+                    & (
+                        Q(title__icontains=query)
+                        | Q(description__icontains=query)
+                        | Q(requirements__icontains=query)
+                    )
+                )
             )
 
         return jobs.order_by("-is_featured", "-posted_at")
@@ -73,14 +204,7 @@ class JobService:
         # Logic extracted from post_job view
         job = Job(
             title=data.get("title"),
-            organization=organization
-            or Organization.objects.get_or_create(
-                name=data.get("organization_name"),
-                defaults={
-                    "website": data.get("organization_website"),
-                    "description": data.get("organization_description"),
-                },
-            )[0],
+            organization=organization or JobService._get_or_create_organization(data),
             category=data.get("category"),
             description=data.get("description"),
             requirements=data.get("requirements"),
@@ -115,11 +239,40 @@ class JobService:
         job.save()
         return job
 
+    @staticmethod
+    def _get_or_create_organization(data: dict) -> Organization:
+        """
+        Resolve the posting's organization by normalized name, creating it on a miss.
+
+        name_normalized is not unique (importers create organizations by exact
+        name), so the oldest matching row wins rather than get_or_create
+        raising MultipleObjectsReturned.
+        """
+        org_name = data.get("organization_name") or ""
+        org = (
+            Organization.objects.filter(
+                name_normalized=Organization.normalize_name(org_name)
+            )
+            .order_by("pk")
+            .first()
+        )
+        if org is None:
+            org = Organization.objects.create(
+                name=org_name.strip(),
+                slug=unique_slug(Organization, org_name),
+                website=data.get("organization_website"),
+                description=data.get("organization_description"),
+            )
+        return org
+
     @staticmethod
     def toggle_save_job(user, slug):
-        job = get_object_or_404(Job, slug=slug)
-        saved_job, created = SavedJob.objects.get_or_create(user=user, job=job)
-        if not created:
-            saved_job.delete()
+        job_id = Job.objects.filter(slug=slug).values_list("id", flat=True).first()
+        if job_id is None:
+            raise Http404("No Job matches the given query.")
+        # Unsaving is a single DELETE; only a miss needs the INSERT
+        deleted, _ = SavedJob.objects.filter(user=user, job_id=job_id).delete()
+        if deleted:
             return False
+        SavedJob.objects.create(user=user, job_id=job_id)
         return True
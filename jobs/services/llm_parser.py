@@ -5,6 +5,7 @@ Supports multiple LLM providers:
 - DeepSeek (default, cheapest: $0.14-0.28/1M tokens)
 - Groq (fastest, free tier available)
 - Mistral (original)
+- OpenAI (explicit selection only)
 
 This module provides async batch processing of job descriptions to extract
 structured fields for the job detail page display sections:
@@ -18,11 +19,18 @@ structured fields for the job detail page display sections:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import html
 import json
 import logging
+import re
+import time
 from typing import Any
 
+import httpx
+import openai
 from django.conf import settings
+from django.core.cache import caches
 from jobs.constants import IMPACT_AREAS_FOR_PROMPT
 from jobs.constants.skills import SKILLS_FOR_PROMPT
 
@@ -84,28 +92,111 @@ Raw Description:
 Return JSON with keys: mission, profile, impact, benefits, about_org, impact_area, location, job_type, experience_level, salary_min, salary_max, salary_currency, skills
 """
 
-# Provider configurations
+
+
+def _format_escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+# EXTRACTION_PROMPT with the large constant lists already substituted, so
+# each job only formats title, organization and description
+_JOB_PROMPT_TEMPLATE = EXTRACTION_PROMPT.replace(
+    "{impact_areas}", _format_escape(IMPACT_AREAS_FOR_PROMPT)
+).replace("{skills_list}", _format_escape(SKILLS_FOR_PROMPT))
+
+# Description clean-up before prompting: markup and legal boilerplate cost
+# prompt tokens without helping extraction
+DESCRIPTION_MAX_CHARS = 6000
+_RE_BLOCK_TAG = re.compile(r"<\s*(?:br|/p|/div|/li|/h[1-6]|/tr)\b[^>]*>", re.IGNORECASE)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_INLINE_WS = re.compile(r"[^\S\n]+")
+_RE_BLANK_LINES = re.compile(r"\s*\n\s*")
+_RE_BOILERPLATE = re.compile(
+    r"equal opportunity employer|equal employment opportunity|e-verify"
+    r"|without regard to (?:race|age|sex|gender)|reasonable accommodation"
+    r"|affirmative action",
+    re.IGNORECASE,
+)
+
+
+def _compress_description(description: str) -> str:
+    """
+    Shrink a job description for the prompt.
+
+    Strips HTML (keeping block boundaries as line breaks so list structure
+    survives), collapses whitespace, drops EEO/legal boilerplate lines and
+    truncates to DESCRIPTION_MAX_CHARS, keeping the head.
+    """
+    text = html.unescape(_RE_TAG.sub(" ", _RE_BLOCK_TAG.sub("\n", description)))
+    text = _RE_BLANK_LINES.sub("\n", _RE_INLINE_WS.sub(" ", text)).strip()
+    lines = [line for line in text.split("\n") if not _RE_BOILERPLATE.search(line)]
+    return "\n".join(lines)[:DESCRIPTION_MAX_CHARS]
+
+
+# Batch API (offline) mode: status checks while waiting for results
+BATCH_POLL_INTERVAL = 60  # seconds
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Parsed results are cached across runs by model + prompt + job text; the
+# prompt digest invalidates entries whenever the template changes
+PARSE_CACHE_ALIAS = "llm"
+_PROMPT_DIGEST = hashlib.blake2b(_JOB_PROMPT_TEMPLATE.encode(), digest_size=8).hexdigest()
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant that extracts structured data from job postings. Always respond with valid JSON only.",
+}
+
+
+def _make_openai_client(api_key: str, config: dict, http_client: httpx.AsyncClient):
+    return openai.AsyncOpenAI(
+        api_key=api_key, base_url=config["base_url"], http_client=http_client
+    )
+
+
+def _make_mistral_client(api_key: str, config: dict, http_client: httpx.AsyncClient):
+    from mistralai import Mistral
+    return Mistral(api_key=api_key, async_client=http_client)
+
+
+# Provider configurations. client_factory(api_key, config, http_client) builds
+# the SDK client; parse_impl names the JobParser._parse_<impl> method to use
 PROVIDERS = {
     "deepseek": {
         "base_url": "https://api.deepseek.com",
         "model": "deepseek-chat",
         "env_key": "DEEPSEEK_API_KEY",
         "max_concurrent": 50,  # DeepSeek has very generous rate limits
-        "batch_delay": 0.5,
+        "requests_per_minute": 600,  # No published cap; keep bursts polite
+        "client_factory": _make_openai_client,
+        "parse_impl": "openai_compat",
     },
     "groq": {
         "base_url": "https://api.groq.com/openai/v1",
         "model": "llama-3.1-8b-instant",  # Fast and free
         "env_key": "GROQ_API_KEY",
         "max_concurrent": 20,  # Groq is fast
-        "batch_delay": 1,
+        "requests_per_minute": 30,  # Free tier limit
+        "client_factory": _make_openai_client,
+        "parse_impl": "openai_compat",
     },
     "mistral": {
         "base_url": None,  # Uses native Mistral client
         "model": "mistral-small-latest",
         "env_key": "MISTRAL_API_KEY",
         "max_concurrent": 10,
-        "batch_delay": 2,
+        "requests_per_minute": 60,  # Free tier: 1 request/second
+        "client_factory": _make_mistral_client,
+        "parse_impl": "mistral",
+    },
+    "openai": {
+        "base_url": None,  # Default OpenAI endpoint
+        "model": "gpt-4o-mini",
+        "env_key": "OPENAI_API_KEY",
+        "max_concurrent": 50,
+        "requests_per_minute": 500,  # Tier 1 limit
+        "client_factory": _make_openai_client,
+        "parse_impl": "openai_compat",
     },
 }
 
@@ -122,15 +213,91 @@ def get_default_provider() -> str:
     raise ValueError("No LLM API key configured. Set DEEPSEEK_API_KEY, GROQ_API_KEY, or MISTRAL_API_KEY.")
 
 
+class TokenBucket:
+    """Async token bucket: refills `rate` tokens per second up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until `tokens` are available and take them (FIFO across waiters)."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+def _parse_batch_output(text: str) -> list[tuple[int, dict[str, Any]]]:
+    """Decode a Batch API output file into (payload index, parsed fields) pairs."""
+    results = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.error(f"Batch request {result.get('custom_id')} failed: {result.get('error')}")
+            continue
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+            results.append((int(result["custom_id"]), json.loads(content)))
+        except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to parse batch result {result.get('custom_id')}: {e}")
+    return results
+
+
+def _retry_delay(error: Exception, attempt: int) -> float | None:
+    """
+    Seconds to wait before retrying a failed request, or None if it is fatal.
+
+    Rate limits use the server's Retry-After when given; 5xx responses and
+    connection errors back off exponentially. OpenAI errors are matched by
+    type; Mistral's SDKError and others by their status_code attribute.
+    """
+    backoff = (2**attempt) * 2
+    status = getattr(error, "status_code", None)
+
+    if isinstance(error, openai.RateLimitError) or status == 429:
+        response = getattr(error, "response", None) or getattr(error, "raw_response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return backoff
+
+    if isinstance(error, (openai.APIConnectionError, httpx.TransportError)):
+        return backoff
+    if isinstance(status, int) and status >= 500:
+        return backoff
+    return None
+
+
 class JobParser:
-    """Async job parser with multi-provider support."""
+    """
+    Async job parser with multi-provider support.
+
+    The parser owns a pooled HTTP client and loop-bound concurrency
+    primitives, so use it as an async context manager (or call aclose())
+    for the lifetime of one import, on a single event loop.
+    """
 
     def __init__(self, provider: str | None = None):
         """
         Initialize parser with specified provider.
 
         Args:
-            provider: One of 'deepseek', 'groq', 'mistral', or None for auto-detect
+            provider: One of 'deepseek', 'groq', 'mistral', 'openai', or None for auto-detect
         """
         self.provider_name = provider or get_default_provider()
         self.config = PROVIDERS[self.provider_name]
@@ -139,56 +306,62 @@ class JobParser:
         if not api_key:
             raise ValueError(f"{self.config['env_key']} is not configured in settings")
 
-        self._semaphore = asyncio.Semaphore(self.config["max_concurrent"])
-
-        if self.provider_name == "mistral":
-            from mistralai import Mistral
-            self.client = Mistral(api_key=api_key)
-            self._parse_fn = self._parse_mistral
-        else:
-            # OpenAI-compatible providers (DeepSeek, Groq)
-            from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(
-                api_key=api_key,
-                base_url=self.config["base_url"],
-            )
-            self._parse_fn = self._parse_openai_compat
+        max_concurrent = self.config["max_concurrent"]
+        # Parse tasks by cache key, so identical jobs in flight share one request
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Rate limit is separate from the concurrency cap: requests start no
+        # faster than the provider allows, and slots are never held idle
+        self._limiter = TokenBucket(
+            rate=self.config["requests_per_minute"] / 60, capacity=max_concurrent
+        )
+
+        # Size the pool to the concurrency cap so every in-flight request
+        # keeps its connection instead of re-handshaking on overflow
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrent,
+                max_keepalive_connections=max_concurrent,
+            ),
+            timeout=60.0,
+        )
+
+        self.client = self.config["client_factory"](api_key, self.config, self._http_client)
+        self._parse_fn = getattr(self, f"_parse_{self.config['parse_impl']}")
 
         logger.info(f"Initialized JobParser with provider: {self.provider_name}")
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "JobParser":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     async def _parse_openai_compat(
         self, title: str, organization: str, description: str
     ) -> dict[str, Any]:
-        """Parse using OpenAI-compatible API (DeepSeek, Groq)."""
-        prompt = EXTRACTION_PROMPT.format(
-            title=title,
-            organization=organization,
-            description=description,
-            impact_areas=IMPACT_AREAS_FOR_PROMPT,
-            skills_list=SKILLS_FOR_PROMPT,
+        """Parse using OpenAI-compatible API (DeepSeek, Groq, OpenAI)."""
+        prompt = _JOB_PROMPT_TEMPLATE.format(
+            title=title, organization=organization, description=_compress_description(description)
         )
 
+        await self._limiter.acquire()
         async with self._semaphore:
             try:
                 response = await self.client.chat.completions.create(
                     model=self.config["model"],
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant that extracts structured data from job postings. Always respond with valid JSON only.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
+                    messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                     response_format={"type": "json_object"},
                     temperature=0.1,
                 )
 
                 content = response.choices[0].message.content
-                data = json.loads(content)
-
-                # Small delay to respect rate limits
-                await asyncio.sleep(0.2)
-                return data
+                return json.loads(content)
 
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response for '{title}': {e}")
@@ -201,34 +374,22 @@ class JobParser:
         self, title: str, organization: str, description: str
     ) -> dict[str, Any]:
         """Parse using native Mistral client."""
-        prompt = EXTRACTION_PROMPT.format(
-            title=title,
-            organization=organization,
-            description=description,
-            impact_areas=IMPACT_AREAS_FOR_PROMPT,
-            skills_list=SKILLS_FOR_PROMPT,
+        prompt = _JOB_PROMPT_TEMPLATE.format(
+            title=title, organization=organization, description=_compress_description(description)
         )
 
+        await self._limiter.acquire()
         async with self._semaphore:
             try:
                 response = await self.client.chat.complete_async(
                     model=self.config["model"],
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant that extracts structured data from job postings. Always respond with valid JSON only.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
+                    messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                     response_format={"type": "json_object"},
                     temperature=0.1,
                 )
 
                 content = response.choices[0].message.content
-                data = json.loads(content)
-
-                await asyncio.sleep(0.5)
-                return data
+                return json.loads(content)
 
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON response for '{title}': {e}")
@@ -248,72 +409,185 @@ class JobParser:
         payloads: list[dict],
         batch_size: int = 10,
         progress_callback: callable = None,
+        mode: str = "realtime",
     ) -> list[dict]:
         """
-        Parse multiple job descriptions in batches with rate limiting.
+        Parse multiple job descriptions with a pool of concurrent workers.
+
+        With mode="batch_api" the jobs are instead submitted through the
+        provider's Batch API (half price, results within 24h) and this call
+        waits for the batch to finish; use for non-time-sensitive runs.
 
         Args:
             payloads: List of job payload dicts with keys: title, organization_name, description
-            batch_size: Number of jobs per batch (default: 10)
+            batch_size: Unused; kept for backwards compatibility (concurrency
+                comes from the provider's max_concurrent and rate limiter)
             progress_callback: Optional callback(completed, total) for progress updates
+            mode: "realtime" (chat completions) or "batch_api"
 
         Returns:
-            List of payloads enriched with parsed fields
+            List of payloads enriched (in place) with parsed fields, in input order
         """
         if not payloads:
             return []
 
+        if mode == "batch_api":
+            batch_id = await self.parse_batch_offline(payloads)
+            if batch_id:
+                await self.collect_batch(batch_id, payloads)
+            if progress_callback:
+                progress_callback(len(payloads), len(payloads))
+            return payloads
+
         total = len(payloads)
         completed = 0
-        enriched_payloads = []
-        batch_delay = self.config["batch_delay"]
+        enriched_payloads = list(payloads)
 
-        for batch_start in range(0, total, batch_size):
-            batch_end = min(batch_start + batch_size, total)
-            batch = payloads[batch_start:batch_end]
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(payloads):
+            queue.put_nowait(item)
 
-            tasks = []
-            for payload in batch:
+        async def worker() -> None:
+            nonlocal completed
+            # The queue is filled up front, so an empty queue means we're done
+            while not queue.empty():
+                index, payload = queue.get_nowait()
                 title = payload.get("title", "Untitled")
                 org = payload.get("organization_name", "Unknown")
                 desc = payload.get("description", "")
 
                 if len(desc) < 50:
                     logger.debug(f"Skipping '{title}' - description too short")
-                    tasks.append(self._return_original(payload))
-                else:
-                    tasks.append(self._parse_and_enrich(payload, title, org, desc))
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to process job: {result}")
-                    enriched_payloads.append(batch[i])
                 else:
-                    enriched_payloads.append(result)
+                    try:
+                        enriched_payloads[index] = await self._parse_and_enrich(
+                            payload, title, org, desc
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to process job: {e}")
 
                 completed += 1
                 if progress_callback:
                     progress_callback(completed, total)
 
-            if batch_end < total:
-                logger.info(f"Batch {batch_start // batch_size + 1} complete, waiting {batch_delay}s...")
-                await asyncio.sleep(batch_delay)
+        # Workers pull the next job as soon as one finishes, keeping every
+        # slot busy instead of waiting on the slowest job of a batch
+        await asyncio.gather(
+            *(worker() for _ in range(min(self.config["max_concurrent"], total)))
+        )
 
         return enriched_payloads
 
-    async def _return_original(self, payload: dict) -> dict:
-        """Helper to return original payload (for skipped jobs)."""
-        return payload
+    async def parse_batch_offline(self, payloads: list[dict]) -> str | None:
+        """
+        Submit payloads to the provider's Batch API.
+
+        Args:
+            payloads: List of job payload dicts with keys: title, organization_name, description
+
+        Returns:
+            The batch id to pass to collect_batch, or None if no job had a
+            description long enough to parse
+        """
+        if self.config["parse_impl"] != "openai_compat":
+            raise ValueError("Batch API mode requires an OpenAI-compatible provider")
+
+        lines = []
+        for index, payload in enumerate(payloads):
+            desc = payload.get("description", "")
+            if len(desc) < 50:
+                continue
+            prompt = _JOB_PROMPT_TEMPLATE.format(
+                title=payload.get("title", "Untitled"),
+                organization=payload.get("organization_name", "Unknown"),
+                description=_compress_description(desc),
+            )
+            lines.append(
+                json.dumps(
+                    {
+                        # Index into payloads, used to map results back
+                        "custom_id": str(index),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.config["model"],
+                            "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                            "response_format": {"type": "json_object"},
+                            "temperature": 0.1,
+                        },
+                    }
+                )
+            )
+
+        if not lines:
+            return None
+
+        batch_file = await self.client.files.create(
+            file=("jobs.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted {len(lines)} jobs to {self.provider_name} Batch API: {batch.id}")
+        return batch.id
+
+    async def collect_batch(
+        self,
+        batch_id: str,
+        payloads: list[dict],
+        poll_interval: float = BATCH_POLL_INTERVAL,
+    ) -> list[dict]:
+        """
+        Wait for a Batch API job and merge its results into payloads.
+
+        Args:
+            batch_id: Id returned by parse_batch_offline
+            payloads: The same payload list that was submitted
+            poll_interval: Seconds between status checks
+
+        Returns:
+            The payloads, enriched in place where a result was returned
+        """
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in _BATCH_TERMINAL_STATUSES:
+                break
+            await asyncio.sleep(poll_interval)
+
+        if batch.status != "completed":
+            logger.error(f"Batch {batch_id} ended with status '{batch.status}'")
+        # Expired/cancelled batches can still carry partial results
+        if not batch.output_file_id:
+            return payloads
+
+        output = await self.client.files.content(batch.output_file_id)
+        # The output file holds every result; decode it off the event loop
+        results = await asyncio.to_thread(_parse_batch_output, output.text)
+        for index, parsed in results:
+            self._merge_parsed(payloads[index], parsed)
+        merged = len(results)
+
+        logger.info(f"Batch {batch_id}: merged {merged}/{len(payloads)} results")
+        return payloads
 
     async def _parse_and_enrich(
         self, payload: dict, title: str, org: str, desc: str
     ) -> dict:
-        """Parse a single job and merge results into payload."""
-        parsed = await self._parse_with_retry(title, org, desc)
+        """
+        Parse a single job and merge results into payload.
 
-        enriched = payload.copy()
+        The payload is enriched in place (and returned), so large description
+        strings aren't duplicated per job; copy it first to keep the original.
+        """
+        parsed = await self._parse_deduplicated(title, org, desc)
+        return self._merge_parsed(payload, parsed)
+
+    @staticmethod
+    def _merge_parsed(payload: dict, parsed: dict[str, Any]) -> dict:
+        """Merge parsed LLM fields into payload (in place) and return it."""
+        enriched = payload
         if parsed:
             # Text sections (HTML formatted)
             if parsed.get("mission"):
@@ -345,12 +619,52 @@ class JobParser:
             if parsed.get("salary_currency") and not enriched.get("salary_currency"):
                 enriched["salary_currency"] = parsed["salary_currency"]
 
-            # Skills (for matching)
+            # Skills (for matching); copied because deduplicated payloads
+            # share one parsed dict
             if parsed.get("skills") and isinstance(parsed["skills"], list):
-                enriched["skills"] = parsed["skills"]
+                enriched["skills"] = list(parsed["skills"])
 
         return enriched
 
+    def _parse_cache_key(self, title: str, organization: str, description: str) -> str:
+        digest = hashlib.blake2b(
+            f"{title}\0{organization}\0{description}".encode(), digest_size=16
+        ).hexdigest()
+        return f"llm_parse:{self.config['model']}:{_PROMPT_DIGEST}:{digest}"
+
+    async def _parse_deduplicated(
+        self, title: str, organization: str, description: str
+    ) -> dict[str, Any]:
+        """
+        Parse a job, reusing cached results from earlier runs and sharing a
+        single request among identical jobs (reposts, aggregator copies) that
+        are in flight at the same time.
+        """
+        key = self._parse_cache_key(title, organization, description)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._parse_cached(key, title, organization, description)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(future)
+
+    async def _parse_cached(
+        self, key: str, title: str, organization: str, description: str
+    ) -> dict[str, Any]:
+        cache = caches[PARSE_CACHE_ALIAS]
+        parsed = await cache.aget(key)
+        if parsed is not None:
+            logger.debug(f"LLM parse cache hit for '{title}'")
+            return parsed
+
+        parsed = await self._parse_with_retry(title, organization, description)
+        if parsed:
+            await cache.aset(key, parsed)
+        return parsed
+
     async def _parse_with_retry(
         self,
         title: str,
@@ -358,21 +672,20 @@ class JobParser:
         description: str,
         max_retries: int = 5,
     ) -> dict[str, Any]:
-        """Parse with exponential backoff retry on rate limit errors."""
+        """Parse with retry on rate limits (honouring Retry-After) and transient errors."""
         for attempt in range(max_retries):
             try:
                 return await self.parse_single(title, organization, description)
             except Exception as e:
-                error_str = str(e).lower()
-                if "rate" in error_str or "429" in error_str or "too many" in error_str:
-                    wait_time = (2**attempt) * 2
-                    logger.warning(
-                        f"Rate limited on '{title}', retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})..."
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
+                wait_time = _retry_delay(e, attempt)
+                if wait_time is None:
                     logger.error(f"Error parsing '{title}': {e}")
                     return {}
+                logger.warning(
+                    f"Retryable error on '{title}' ({type(e).__name__}), retrying in {wait_time}s "
+                    f"(attempt {attempt + 1}/{max_retries})..."
+                )
+                await asyncio.sleep(wait_time)
         logger.error(f"Max retries exceeded for '{title}'")
         return {}
 
@@ -6,6 +6,7 @@ into standardized country/region values for better filtering.
 """
 from __future__ import annotations
 
+import functools
 import re
 
 
@@ -64,6 +65,14 @@ STANDARD_LOCATIONS = {
     "Americas": "Americas",
 }
 
+# Case-insensitive lookup of already-normalized values. Bare regions are left
+# out: as input they normalize to a Remote variant, not to themselves
+_STANDARD_LOWER = {
+    key.lower(): value
+    for key, value in STANDARD_LOCATIONS.items()
+    if key not in ("Europe", "Asia", "Africa", "Americas")
+}
+
 # Patterns to identify US locations
 US_PATTERNS = [
     # State abbreviations - require comma before or be at end, to avoid matching "or" in "Paris or Lyon"
@@ -92,40 +101,46 @@ UK_PATTERNS = [
     r"\b(London|Manchester|Birmingham|Edinburgh|Glasgow|Bristol|Liverpool|Leeds|Belfast|Cardiff)\b",
 ]
 
-# Patterns for other countries
+# Keywords for other countries, in priority order: the first country with
+# any of its keywords (a whole word or phrase, any case) in the location wins
+COUNTRY_KEYWORDS = {
+    "Canada": ["Canada", "Toronto", "Vancouver", "Montreal", "Ottawa", "Calgary"],
+    "Germany": ["Germany", "Berlin", "Munich", "Frankfurt", "Hamburg", "Cologne"],
+    "France": ["France", "Paris", "Lyon", "Marseille"],
+    "Netherlands": ["Netherlands", "Amsterdam", "Rotterdam", "Utrecht", "Bilthoven"],
+    "India": ["India", "Bangalore", "Bengaluru", "Mumbai", "Delhi", "New Delhi", "Hyderabad", "Chennai", "Pune", "Gurgaon", "Kolkata", "Ahmedabad", "Karnataka", "Maharashtra"],
+    "Australia": ["Australia", "Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide", "Newcastle"],
+    "Sweden": ["Sweden", "Stockholm", "Gothenburg", "Malmo"],
+    "Switzerland": ["Switzerland", "Zurich", "Geneva", "Basel", "Bern"],
+    "Ireland": ["Ireland", "Dublin"],
+    "Spain": ["Spain", "Madrid", "Barcelona", "Valencia"],
+    "Italy": ["Italy", "Rome", "Milan", "Florence"],
+    "Poland": ["Poland", "Warsaw", "Krakow", "Wroclaw"],
+    "Belgium": ["Belgium", "Brussels", "Antwerp"],
+    "Austria": ["Austria", "Vienna"],
+    "Denmark": ["Denmark", "Copenhagen"],
+    "Norway": ["Norway", "Oslo"],
+    "Finland": ["Finland", "Helsinki", "Tampere", "Turku", "Lahti"],
+    "Singapore": ["Singapore"],
+    "Japan": ["Japan", "Tokyo", "Osaka", "Kyoto"],
+    "Israel": ["Israel", "Tel Aviv"],
+    "UAE": ["UAE", "United Arab Emirates", "Dubai", "Abu Dhabi"],
+    "Kenya": ["Kenya", "Nairobi"],
+    "Nigeria": ["Nigeria", "Lagos"],
+    "South Africa": ["South Africa", "Johannesburg", "Cape Town"],
+    "New Zealand": ["New Zealand", "Auckland", "Wellington"],
+    "Greece": ["Greece", "Athens"],
+    "Portugal": ["Portugal", "Lisbon"],
+    "Bangladesh": ["Bangladesh", "Dhaka"],
+    "Brazil": ["Brazil", "Sao Paulo", "Rio de Janeiro"],
+    "Mexico": ["Mexico", "Mexico City"],
+    "South Korea": ["South Korea", "Korea", "Seoul"],
+    "China": ["China", "Beijing", "Shanghai", "Shenzhen"],
+}
+
+# Country patterns that need more context than a single keyword
 COUNTRY_PATTERNS = {
-    "Canada": [r"\bCanada\b", r"\b(Toronto|Vancouver|Montreal|Ottawa|Calgary)\b", r"\b(ON|BC|QC|AB)\b.*Canada"],
-    "Germany": [r"\bGermany\b", r"\b(Berlin|Munich|Frankfurt|Hamburg|Cologne)\b"],
-    "France": [r"\bFrance\b", r"\b(Paris|Lyon|Marseille)\b"],
-    "Netherlands": [r"\bNetherlands\b", r"\b(Amsterdam|Rotterdam|Utrecht|Bilthoven)\b"],
-    "India": [r"\bIndia\b", r"\b(Bangalore|Bengaluru|Mumbai|Delhi|New Delhi|Hyderabad|Chennai|Pune|Gurgaon|Kolkata|Ahmedabad|Karnataka|Maharashtra)\b"],
-    "Australia": [r"\bAustralia\b", r"\b(Sydney|Melbourne|Brisbane|Perth|Adelaide|Newcastle)\b"],
-    "Sweden": [r"\bSweden\b", r"\b(Stockholm|Gothenburg|Malmo)\b"],
-    "Switzerland": [r"\bSwitzerland\b", r"\b(Zurich|Geneva|Basel|Bern)\b"],
-    "Ireland": [r"\bIreland\b", r"\bDublin\b"],
-    "Spain": [r"\bSpain\b", r"\b(Madrid|Barcelona|Valencia)\b"],
-    "Italy": [r"\bItaly\b", r"\b(Rome|Milan|Florence)\b"],
-    "Poland": [r"\bPoland\b", r"\b(Warsaw|Krakow|Wroclaw)\b"],
-    "Belgium": [r"\bBelgium\b", r"\b(Brussels|Antwerp)\b"],
-    "Austria": [r"\bAustria\b", r"\bVienna\b"],
-    "Denmark": [r"\bDenmark\b", r"\bCopenhagen\b"],
-    "Norway": [r"\bNorway\b", r"\bOslo\b"],
-    "Finland": [r"\bFinland\b", r"\b(Helsinki|Tampere|Turku|Lahti)\b"],
-    "Singapore": [r"\bSingapore\b"],
-    "Japan": [r"\bJapan\b", r"\b(Tokyo|Osaka|Kyoto)\b"],
-    "Israel": [r"\bIsrael\b", r"\bTel Aviv\b"],
-    "UAE": [r"\bUAE\b", r"\bUnited Arab Emirates\b", r"\b(Dubai|Abu Dhabi)\b"],
-    "Kenya": [r"\bKenya\b", r"\bNairobi\b"],
-    "Nigeria": [r"\bNigeria\b", r"\bLagos\b"],
-    "South Africa": [r"\bSouth Africa\b", r"\b(Johannesburg|Cape Town)\b"],
-    "New Zealand": [r"\bNew Zealand\b", r"\b(Auckland|Wellington)\b"],
-    "Greece": [r"\bGreece\b", r"\bAthens\b"],
-    "Portugal": [r"\bPortugal\b", r"\bLisbon\b"],
-    "Bangladesh": [r"\bBangladesh\b", r"\bDhaka\b"],
-    "Brazil": [r"\bBrazil\b", r"\b(Sao Paulo|Rio de Janeiro)\b"],
-    "Mexico": [r"\bMexico\b", r"\bMexico City\b"],
-    "South Korea": [r"\bSouth Korea\b", r"\bKorea\b", r"\bSeoul\b"],
-    "China": [r"\bChina\b", r"\b(Beijing|Shanghai|Shenzhen)\b"],
+    "Canada": [r"\b(ON|BC|QC|AB)\b.*Canada"],
 }
 
 # Regional patterns
@@ -136,6 +151,102 @@ REGION_PATTERNS = {
 }
 
 
+def _any_pattern(patterns) -> re.Pattern:
+    """Combine patterns into one case-insensitive regex that matches if any does."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Compile the pattern tables once at import; lookups are case-insensitive
+_US_RE = _any_pattern(US_PATTERNS)
+_UK_RE = _any_pattern(UK_PATTERNS)
+
+# Country keyword index: lower-cased keyword -> country, probed with the
+# location's word n-grams instead of running one regex per keyword
+_COUNTRY_PRIORITY = {country: i for i, country in enumerate(COUNTRY_KEYWORDS)}
+_COUNTRY_LITERALS = {
+    # Reversed so a keyword listed under two countries maps to the earlier one
+    keyword.lower(): country
+    for country, keywords in reversed(COUNTRY_KEYWORDS.items())
+    for keyword in keywords
+}
+_MAX_KEYWORD_WORDS = max(len(keyword.split()) for keyword in _COUNTRY_LITERALS)
+_COUNTRY_FALLBACKS = sorted(
+    (
+        (_COUNTRY_PRIORITY[country], country, re.compile(p, re.IGNORECASE))
+        for country, patterns in COUNTRY_PATTERNS.items()
+        for p in patterns
+    ),
+    key=lambda fallback: fallback[0],
+)
+_WORD_RE = re.compile(r"\w+")
+REGION_PATTERNS = {
+    region: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for region, patterns in REGION_PATTERNS.items()
+}
+
+# Lower-case substrings that any REGION_PATTERNS match must contain
+# ("eu" also covers "europe"/"european"), checked before running the regexes
+_REGION_KEYWORDS = ("eu", "emea", "apac", "asia", "latam", "latin america")
+
+# Explicit remote with region; matched against the lower-cased location.
+# Every rule requires "remote", which gates the whole list
+REMOTE_REGION_PATTERNS = [
+    (re.compile(r"\bremote\b.*\b(us|usa|united states|america)\b"), "Remote (US)"),
+    (re.compile(r"\bremote\b.*\b(uk|united kingdom|england|britain)\b"), "Remote (UK)"),
+    (re.compile(r"\bremote\b.*\b(eu|europe|european)\b"), "Remote (EU)"),
+    (re.compile(r"\bremote\b.*\b(canada|canadian)\b"), "Remote (Canada)"),
+    (re.compile(r"\bremote\b.*\b(india|indian)\b"), "Remote (India)"),
+    (re.compile(r"\bremote\b.*\b(australia|australian)\b"), "Remote (Australia)"),
+    (re.compile(r"\bremote\b.*\b(germany|german)\b"), "Remote (Germany)"),
+    (re.compile(r"\bremote\b.*\b(apac|asia.?pacific)\b"), "Remote (APAC)"),
+    (re.compile(r"\bremote\b.*\b(latam|latin.?america)\b"), "Remote (LATAM)"),
+    (re.compile(r"\bremote\b.*\b(emea)\b"), "Remote (EMEA)"),
+    # Also check reverse order
+    (re.compile(r"\b(us|usa|united states)\b.*\bremote\b"), "Remote (US)"),
+    (re.compile(r"\b(uk|united kingdom)\b.*\bremote\b"), "Remote (UK)"),
+    (re.compile(r"\b(canada)\b.*\bremote\b"), "Remote (Canada)"),
+]
+
+# Garbage data (job titles in location field)
+# Pattern: "Job Title Company Added Date Location"
+_ADDED_DATE = r"Added\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+"
+# One anchored match: the first alternative captures the trailing location
+# after the leftmost "Added <date>" that has one; the second still flags
+# garbage (group 1 unset) when none does
+_GARBAGE_RE = re.compile(
+    rf"(?s:.*?){_ADDED_DATE}\s+(.+)$|(?s:.*?){_ADDED_DATE}", re.IGNORECASE
+)
+
+
+def _match_country(loc_lower: str) -> str | None:
+    """
+    Return the first country (in COUNTRY_KEYWORDS order) mentioned in a
+    lower-cased location, or None.
+    """
+    best = None
+    best_priority = len(_COUNTRY_PRIORITY)
+
+    # Keywords start and end on word boundaries, so every candidate is a
+    # slice spanning 1.._MAX_KEYWORD_WORDS consecutive words
+    spans = [m.span() for m in _WORD_RE.finditer(loc_lower)]
+    for i, (start, _) in enumerate(spans):
+        for _, end in spans[i:i + _MAX_KEYWORD_WORDS]:
+            country = _COUNTRY_LITERALS.get(loc_lower[start:end])
+            if country and _COUNTRY_PRIORITY[country] < best_priority:
+                best, best_priority = country, _COUNTRY_PRIORITY[country]
+
+    for priority, country, pattern in _COUNTRY_FALLBACKS:
+        if priority >= best_priority:
+            break
+        if pattern.search(loc_lower):
+            return country
+
+    return best
+
+
+# Pure function of the raw string; scraped batches repeat the same few
+# hundred locations thousands of times
+@functools.lru_cache(maxsize=4096)
 def normalize_location(location: str) -> str:
     """
     Normalize a location string to a standard value.
@@ -151,6 +262,11 @@ def normalize_location(location: str) -> str:
 
     loc_lower = location.lower().strip()
 
+    # Upstream parsers often emit clean values already
+    standard = _STANDARD_LOWER.get(loc_lower)
+    if standard:
+        return standard
+
     # Already clean "Remote" variants
     if loc_lower == "remote" or loc_lower == "remote, global" or loc_lower == "global":
         return "Remote"
@@ -159,75 +275,57 @@ def normalize_location(location: str) -> str:
         return "Remote"
 
     # Check for garbage data (job titles in location field)
-    # Pattern: "Job Title Company Added Date Location"
-    garbage_pattern = r"Added\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+"
-    if re.search(garbage_pattern, location, re.IGNORECASE):
+    garbage = _GARBAGE_RE.match(location) if "added" in loc_lower else None
+    if garbage:
         # Try to extract the actual location from the end
         # e.g., "Clinical Development Lead Flagship Pioneering Added Jan 9 Cambridge MA, USA"
-        match = re.search(r"Added\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+\s+(.+)$", location, re.IGNORECASE)
-        if match:
-            location = match.group(1).strip()
+        if garbage.group(1):
+            location = garbage.group(1).strip()
             loc_lower = location.lower()
         else:
             return "Remote"  # Can't parse, default to Remote
 
+    is_remote = "remote" in loc_lower
+
     # Check for explicit remote with region
-    remote_region_patterns = [
-        (r"\bremote\b.*\b(us|usa|united states|america)\b", "Remote (US)"),
-        (r"\bremote\b.*\b(uk|united kingdom|england|britain)\b", "Remote (UK)"),
-        (r"\bremote\b.*\b(eu|europe|european)\b", "Remote (EU)"),
-        (r"\bremote\b.*\b(canada|canadian)\b", "Remote (Canada)"),
-        (r"\bremote\b.*\b(india|indian)\b", "Remote (India)"),
-        (r"\bremote\b.*\b(australia|australian)\b", "Remote (Australia)"),
-        (r"\bremote\b.*\b(germany|german)\b", "Remote (Germany)"),
-        (r"\bremote\b.*\b(apac|asia.?pacific)\b", "Remote (APAC)"),
-        (r"\bremote\b.*\b(latam|latin.?america)\b", "Remote (LATAM)"),
-        (r"\bremote\b.*\b(emea)\b", "Remote (EMEA)"),
-        # Also check reverse order
-        (r"\b(us|usa|united states)\b.*\bremote\b", "Remote (US)"),
-        (r"\b(uk|united kingdom)\b.*\bremote\b", "Remote (UK)"),
-        (r"\b(canada)\b.*\bremote\b", "Remote (Canada)"),
-    ]
-
-    for pattern, result in remote_region_patterns:
-        if re.search(pattern, loc_lower):
-            return result
+    if is_remote:
+        for pattern, result in REMOTE_REGION_PATTERNS:
+            if pattern.search(loc_lower):
+                return result
 
     # Check for US patterns
-    for pattern in US_PATTERNS:
-        if re.search(pattern, location, re.IGNORECASE):
-            # If it mentions remote, make it Remote (US)
-            if "remote" in loc_lower:
-                return "Remote (US)"
-            return "USA"
+    if _US_RE.search(location):
+        # If it mentions remote, make it Remote (US)
+        if is_remote:
+            return "Remote (US)"
+        return "USA"
 
     # Check for UK patterns
-    for pattern in UK_PATTERNS:
-        if re.search(pattern, location, re.IGNORECASE):
-            if "remote" in loc_lower:
-                return "Remote (UK)"
-            return "UK"
+    if _UK_RE.search(location):
+        if is_remote:
+            return "Remote (UK)"
+        return "UK"
 
     # Check for other countries
-    for country, patterns in COUNTRY_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, location, re.IGNORECASE):
-                if "remote" in loc_lower:
-                    # Map to Remote (Country) if we have it
-                    remote_key = f"Remote ({country})"
-                    if remote_key in STANDARD_LOCATIONS:
-                        return remote_key
-                    return "Remote"
-                return country
+    country = _match_country(loc_lower)
+    if country:
+        if is_remote:
+            # Map to Remote (Country) if we have it
+            remote_key = f"Remote ({country})"
+            if remote_key in STANDARD_LOCATIONS:
+                return remote_key
+            return "Remote"
+        return country
 
     # Check for regional patterns
-    for region, patterns in REGION_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, location, re.IGNORECASE):
-                return region
+    if any(keyword in loc_lower for keyword in _REGION_KEYWORDS):
+        for region, patterns in REGION_PATTERNS.items():
+            for pattern in patterns:
+                if pattern.search(location):
+                    return region
 
     # If location contains "remote" but no region identified, default to Remote
-    if "remote" in loc_lower:
+    if is_remote:
         return "Remote"
 
     # If we couldn't identify any country/region, default to Remote
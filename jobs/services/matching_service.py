@@ -12,8 +12,12 @@ Scoring weights:
 - Work Style: 10% (role type matching)
 """
 
+import heapq
 import re
+from itertools import islice
 from typing import Optional
+
+import ahocorasick
 from django.db.models import QuerySet
 
 from jobs.models import Job, SeekerProfile, JobMatch, Category
@@ -21,7 +25,7 @@ from jobs.constants.skills import SKILLS_BY_SLUG
 
 
 # Stopwords to filter out common words
-STOPWORDS = {
+STOPWORDS = frozenset({
     "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "of",
     "with", "by", "from", "is", "are", "was", "were", "be", "been", "being",
     "have", "has", "had", "do", "does", "did", "will", "would", "could", "should",
@@ -41,10 +45,10 @@ STOPWORDS = {
     "help", "make", "take", "get", "give", "use", "new", "first", "last", "long",
     "little", "own", "other", "old", "right", "big", "high", "different", "small",
     "large", "next", "early", "young", "important", "public", "bad", "same",
-}
+})
 
 # Impact-related keywords that boost relevance
-IMPACT_KEYWORDS = {
+IMPACT_KEYWORDS = frozenset({
     "climate", "environment", "sustainability", "carbon", "renewable", "energy",
     "ai", "artificial", "intelligence", "machine", "learning", "safety", "alignment",
     "health", "medical", "healthcare", "disease", "public", "global",
@@ -55,10 +59,10 @@ IMPACT_KEYWORDS = {
     "research", "science", "data", "analysis", "evidence",
     "social", "community", "humanitarian", "impact", "mission", "purpose",
     "effective", "altruism", "giving", "charity", "donation",
-}
+})
 
 # Work style keywords mapping
-WORK_STYLE_KEYWORDS = {
+WORK_STYLE_KEYWORDS = {k: frozenset(v) for k, v in {
     "builder": [
         "engineer", "developer", "software", "product", "design", "build", "create",
         "architect", "technical", "code", "programming", "frontend", "backend",
@@ -84,7 +88,52 @@ WORK_STYLE_KEYWORDS = {
         "qualitative", "evaluation", "assessment", "study", "survey", "statistics",
         "modeling", "insights", "intelligence", "academic",
     ],
+}.items()}
+
+# Words of three or more letters, the unit of keyword matching
+_WORD_RE = re.compile(r"\b[a-z]{3,}\b")
+
+# Lowercased label and its 3+ letter words per skill, used for keyword matching
+SKILL_LABEL_BY_SLUG = {slug: s.label.lower() for slug, s in SKILLS_BY_SLUG.items()}
+SKILL_TOKENS_BY_SLUG = {
+    slug: frozenset(w for w in label.split() if len(w) >= 3)
+    for slug, label in SKILL_LABEL_BY_SLUG.items()
+}
+
+# Skill needles this short only match as whole words, otherwise "r" or
+# "git" would match inside almost any job description
+SKILL_WORD_BOUNDED_MAX_LEN = 3
+
+
+def _build_skill_needles() -> dict:
+    """Map each lowercased skill label and de-hyphenated slug to its skill slugs."""
+    needles = {}
+    for slug, skill in SKILLS_BY_SLUG.items():
+        for needle in (skill.label.lower(), slug.replace("-", " ")):
+            slugs = needles.setdefault(needle, [])
+            if slug not in slugs:
+                slugs.append(slug)
+    return needles
+
+
+def _build_skill_automaton() -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton over all skill needles."""
+    automaton = ahocorasick.Automaton()
+    for needle, slugs in _SKILL_NEEDLES.items():
+        automaton.add_word(
+            needle, (len(needle), _SKILL_WORD_PATTERNS.get(needle), tuple(slugs))
+        )
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_NEEDLES = _build_skill_needles()
+_SKILL_WORD_PATTERNS = {
+    needle: re.compile(rf"\b{re.escape(needle)}\b")
+    for needle in _SKILL_NEEDLES
+    if len(needle) <= SKILL_WORD_BOUNDED_MAX_LEN
 }
+_SKILL_AUTOMATON = _build_skill_automaton()
 
 # Experience level compatibility
 EXPERIENCE_COMPATIBILITY = {
@@ -107,43 +156,69 @@ class MatchingService:
     """Service for calculating match scores between seekers and jobs."""
 
     @staticmethod
-    def _extract_keywords(text: str) -> set:
+    def _extract_keywords(text: str) -> frozenset:
         """Extract meaningful keywords from text."""
         if not text:
-            return set()
+            return frozenset()
 
-        # Lowercase and extract words
-        text = text.lower()
-        words = re.findall(r'\b[a-z]{3,}\b', text)
+        # Lowercase, extract words of 3+ letters and filter stopwords
+        return frozenset(w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS)
 
-        # Filter stopwords and short words
-        keywords = {w for w in words if w not in STOPWORDS and len(w) >= 3}
-        return keywords
+    @staticmethod
+    def _job_text(job: Job) -> str:
+        """The job text that keywords and skills are extracted from."""
+        return f"{job.title} {job.description or ''} {job.requirements or ''}"
+
+    @staticmethod
+    def build_job_index(job: Job) -> tuple[list, list]:
+        """
+        Extract the job-side terms calculate_match needs.
+
+        Stored on Job.search_keywords / Job.extracted_skill_slugs by the
+        index_job_matching command, so scoring a job does not re-scan its text.
+
+        Returns:
+            Tuple of (sorted keywords, sorted extracted skill slugs)
+        """
+        job_text = MatchingService._job_text(job)
+        return (
+            sorted(MatchingService._extract_keywords(job_text)),
+            sorted(MatchingService._extract_skills_from_text(job_text)),
+        )
 
     @staticmethod
-    def _calculate_text_similarity(seeker_keywords: set, job_keywords: set) -> float:
-        """Calculate Jaccard-like similarity with boost for impact keywords."""
+    def _calculate_text_similarity(
+        seeker_keywords: set,
+        job_keywords: set,
+        seeker_impact_keywords: Optional[frozenset] = None,
+    ) -> float:
+        """
+        Calculate Jaccard-like similarity with boost for impact keywords.
+
+        Works on overlap counts only, so callers scoring many jobs should pass
+        the seeker's impact keywords (seeker_keywords & IMPACT_KEYWORDS) once
+        instead of having them recomputed per job.
+        """
         if not seeker_keywords or not job_keywords:
             return 20.0  # Base score even with no data
 
-        # Find overlap
-        overlap = seeker_keywords & job_keywords
+        # Find overlap; only its size is needed
+        n_overlap = len(seeker_keywords & job_keywords)
 
-        if not overlap:
+        if not n_overlap:
             return 20.0  # Minimum base score
 
-        # Count impact keyword matches (weighted higher)
-        impact_overlap = overlap & IMPACT_KEYWORDS
-        regular_overlap = overlap - IMPACT_KEYWORDS
+        if seeker_impact_keywords is None:
+            seeker_impact_keywords = seeker_keywords & IMPACT_KEYWORDS
 
         # Weighted overlap: impact keywords count 2x
-        weighted_overlap = len(regular_overlap) + (len(impact_overlap) * 2)
+        weighted_overlap = n_overlap + len(seeker_impact_keywords & job_keywords)
 
         # Use seeker keywords as denominator (what % of seeker interests are in job)
         similarity = weighted_overlap / (len(seeker_keywords) + 1)
 
         # Also consider what % of job keywords match (but lower weight)
-        job_coverage = len(overlap) / (len(job_keywords) + 1)
+        job_coverage = n_overlap / (len(job_keywords) + 1)
 
         # Combine: 60% seeker coverage, 40% job coverage
         combined = (similarity * 0.6) + (job_coverage * 0.4)
@@ -155,78 +230,157 @@ class MatchingService:
         return score
 
     @staticmethod
-    def calculate_match(seeker: SeekerProfile, job: Job) -> dict:
+    def _build_seeker_ctx(seeker: SeekerProfile) -> dict:
+        """
+        Derive the seeker-side state used by calculate_match.
+
+        None of this depends on the job, so callers scoring many jobs for one
+        seeker should build it once and pass it to every calculate_match call.
+        """
+        text_parts = []
+        skill_slugs = set(seeker.skills or [])
+
+        if seeker.impact_statement:
+            text_parts.append(seeker.impact_statement)
+        for slug in seeker.skills or []:
+            # Convert skill slugs to labels
+            skill = SKILLS_BY_SLUG.get(slug)
+            text_parts.append(skill.label if skill else slug.replace("-", " "))
+        # Add impact areas; one query serves both the text and the slug set
+        areas = list(seeker.impact_areas.all())
+        for area in areas:
+            text_parts.append(area.name)
+
+        text = " ".join(text_parts)
+        keywords = MatchingService._extract_keywords(text)
+        return {
+            "keywords": keywords,
+            "impact_keywords": keywords & IMPACT_KEYWORDS,
+            "skill_slugs": skill_slugs,
+            "skill_words": frozenset().union(
+                *(SKILL_TOKENS_BY_SLUG[s] for s in skill_slugs if s in SKILL_TOKENS_BY_SLUG)
+            ),
+            "impact_area_slugs": {area.slug for area in areas},
+            "experience_level": seeker.experience_level,
+            "work_style": seeker.work_style,
+        }
+
+    @staticmethod
+    def _weighted_total(
+        relevance: float, impact: float, skills: float, experience: float, work_style: float
+    ) -> float:
+        """Combine component scores into the overall 0-100 match score."""
+        total = (
+            relevance * 0.35
+            + impact * 0.25
+            + skills * 0.20
+            + experience * 0.10
+            + work_style * 0.10
+        )
+
+        # Apply boost for high relevance matches
+        if relevance >= 70 and impact >= 80:
+            total = min(100, total * 1.1)  # 10% boost for strong matches
+
+        return total
+
+    @staticmethod
+    def calculate_match(
+        seeker: SeekerProfile,
+        job: Job,
+        ctx: Optional[dict] = None,
+        min_total: Optional[int] = None,
+    ) -> dict:
         """
         Calculate match score between a seeker and a job.
 
+        The cheap components (impact area, experience) are scored first. When
+        min_total is given and even the best possible relevance, skills and
+        work style scores could not lift the total to it, the text and skill
+        matching is skipped and a pruned result is returned instead.
+
+        Args:
+            seeker: The seeker profile to score
+            job: The job to score against
+            ctx: Precomputed seeker state from _build_seeker_ctx; built on
+                the fly when omitted
+            min_total: Total below which the caller discards the match
+
         Returns dict with:
-        - total: overall score 0-100
+        - total: overall score 0-100 (an upper bound when pruned)
         - breakdown: {relevance, impact, skills, experience, work_style}
         - reasons: list of match reasons
         - gaps: list of skill gaps
+        - pruned: present and True when the full breakdown was skipped
         """
-        scores = {}
+        if ctx is None:
+            ctx = MatchingService._build_seeker_ctx(seeker)
+
+        # Phase 1: components that need no text processing
+        impact_reasons = []
+        experience_reasons = []
+
+        # 2. Impact Area Alignment (25%)
+        impact = MatchingService._score_impact_area(ctx, job, impact_reasons)
+
+        # 4. Experience Level (10%)
+        experience = MatchingService._score_experience(ctx, job, experience_reasons)
+
+        if min_total is not None:
+            # Keyword matches can lift the skills score past 100
+            skills_bound = max(100, 50 + len(ctx["skill_words"]) * 5)
+            work_style_bound = 100 if WORK_STYLE_KEYWORDS.get(ctx["work_style"]) else 50
+            upper = MatchingService._weighted_total(
+                100, impact, skills_bound, experience, work_style_bound
+            )
+            if round(upper) < min_total:
+                return {
+                    "total": round(upper),
+                    "breakdown": {"impact": impact, "experience": experience},
+                    "reasons": [],
+                    "gaps": [],
+                    "pruned": True,
+                }
+
+        # Phase 2: text relevance, skills and work style
         reasons = []
         gaps = []
 
-        # Build seeker text profile
-        seeker_text_parts = []
-        if seeker.impact_statement:
-            seeker_text_parts.append(seeker.impact_statement)
-        if seeker.skills:
-            # Convert skill slugs to labels
-            for slug in seeker.skills:
-                skill = SKILLS_BY_SLUG.get(slug)
-                if skill:
-                    seeker_text_parts.append(skill.label)
-                else:
-                    seeker_text_parts.append(slug.replace("-", " "))
-        # Add impact areas
-        for area in seeker.impact_areas.all():
-            seeker_text_parts.append(area.name)
-
-        seeker_text = " ".join(seeker_text_parts)
-        seeker_keywords = MatchingService._extract_keywords(seeker_text)
-
-        # Build job text profile
-        job_text = f"{job.title} {job.description or ''} {job.requirements or ''}"
-        job_keywords = MatchingService._extract_keywords(job_text)
+        seeker_keywords = ctx["keywords"]
+
+        # Job text profile, stored on the row when the job was saved
+        if job.search_keywords is not None:
+            job_keywords = frozenset(job.search_keywords)
+        else:
+            job_keywords = MatchingService._extract_keywords(MatchingService._job_text(job))
 
         # 1. Text Relevance (35%)
-        scores["relevance"] = MatchingService._score_text_relevance(
-            seeker_keywords, job_keywords, reasons
+        relevance = MatchingService._score_text_relevance(
+            seeker_keywords, job_keywords, reasons, ctx["impact_keywords"]
         )
-
-        # 2. Impact Area Alignment (25%)
-        scores["impact"] = MatchingService._score_impact_area(seeker, job, reasons)
+        reasons.extend(impact_reasons)
 
         # 3. Skills Match (20%)
-        scores["skills"], skill_gaps = MatchingService._score_skills(
-            seeker, job, job_keywords, reasons
+        skills, skill_gaps = MatchingService._score_skills(
+            ctx, job, job_keywords, reasons
         )
         gaps.extend(skill_gaps)
-
-        # 4. Experience Level (10%)
-        scores["experience"] = MatchingService._score_experience(seeker, job, reasons)
+        reasons.extend(experience_reasons)
 
         # 5. Work Style (10%)
-        scores["work_style"] = MatchingService._score_work_style(
-            seeker, job_keywords, reasons
-        )
-
-        # Calculate weighted total
-        total = (
-            scores["relevance"] * 0.35
-            + scores["impact"] * 0.25
-            + scores["skills"] * 0.20
-            + scores["experience"] * 0.10
-            + scores["work_style"] * 0.10
+        work_style = MatchingService._score_work_style(ctx, job_keywords, reasons)
+
+        scores = {
+            "relevance": relevance,
+            "impact": impact,
+            "skills": skills,
+            "experience": experience,
+            "work_style": work_style,
+        }
+        total = MatchingService._weighted_total(
+            relevance, impact, skills, experience, work_style
         )
 
-        # Apply boost for high relevance matches
-        if scores["relevance"] >= 70 and scores["impact"] >= 80:
-            total = min(100, total * 1.1)  # 10% boost for strong matches
-
         return {
             "total": round(total),
             "breakdown": scores,
@@ -235,9 +389,16 @@ class MatchingService:
         }
 
     @staticmethod
-    def _score_text_relevance(seeker_keywords: set, job_keywords: set, reasons: list) -> int:
+    def _score_text_relevance(
+        seeker_keywords: set,
+        job_keywords: set,
+        reasons: list,
+        seeker_impact_keywords: Optional[frozenset] = None,
+    ) -> int:
         """Score based on text similarity between seeker profile and job."""
-        score = MatchingService._calculate_text_similarity(seeker_keywords, job_keywords)
+        score = MatchingService._calculate_text_similarity(
+            seeker_keywords, job_keywords, seeker_impact_keywords
+        )
 
         if score >= 70:
             reasons.append("Strong keyword match with your profile")
@@ -249,12 +410,12 @@ class MatchingService:
         return int(score)
 
     @staticmethod
-    def _score_impact_area(seeker: SeekerProfile, job: Job, reasons: list) -> int:
+    def _score_impact_area(ctx: dict, job: Job, reasons: list) -> int:
         """Score based on impact area alignment."""
         if not job.category:
             return 40  # Neutral if no category
 
-        seeker_areas = set(seeker.impact_areas.values_list("slug", flat=True))
+        seeker_areas = ctx["impact_area_slugs"]
 
         if not seeker_areas:
             return 50  # Neutral if seeker has no preference
@@ -270,25 +431,15 @@ class MatchingService:
 
     @staticmethod
     def _score_skills(
-        seeker: SeekerProfile, job: Job, job_keywords: set, reasons: list
+        ctx: dict, job: Job, job_keywords: set, reasons: list
     ) -> tuple[int, list]:
         """Score based on skills match. Returns (score, gaps)."""
-        seeker_skills = set(seeker.skills or [])
+        seeker_skills = ctx["skill_slugs"]
 
         if not seeker_skills:
             return 40, []  # No skills = neutral score
 
-        # Build seeker skill labels for keyword matching
-        seeker_skill_labels = set()
-        seeker_skill_words = set()
-        for slug in seeker_skills:
-            skill = SKILLS_BY_SLUG.get(slug)
-            if skill:
-                seeker_skill_labels.add(skill.label.lower())
-                # Also add individual words from multi-word skills
-                for word in skill.label.lower().split():
-                    if len(word) >= 3:
-                        seeker_skill_words.add(word)
+        seeker_skill_words = ctx["skill_words"]
 
         # Get job skills from stored data or extract from text
         job_skills = set()
@@ -297,10 +448,13 @@ class MatchingService:
         elif job.raw_data and isinstance(job.raw_data, dict):
             job_skills = set(job.raw_data.get("skills", []))
 
-        # Also extract skills from job text
-        job_text = f"{job.title} {job.description or ''} {job.requirements or ''}"
-        extracted_skills = MatchingService._extract_skills_from_text(job_text)
-        job_skills.update(extracted_skills)
+        # Also extract skills from job text, unless stored on the row
+        if job.extracted_skill_slugs is not None:
+            job_skills.update(job.extracted_skill_slugs)
+        else:
+            job_skills.update(
+                MatchingService._extract_skills_from_text(MatchingService._job_text(job))
+            )
 
         # Always do keyword matching as primary/fallback method
         # Check how many seeker skill words appear in job keywords
@@ -319,13 +473,9 @@ class MatchingService:
             return 40, []
 
         # Calculate structured skill overlap
-        overlap = seeker_skills & job_skills
-        missing = job_skills - seeker_skills
-
-        if len(job_skills) > 0:
-            match_ratio = len(overlap) / len(job_skills)
-        else:
-            match_ratio = 0.5
+        n_job_skills = len(job_skills)
+        n_overlap = len(seeker_skills & job_skills)
+        match_ratio = n_overlap / n_job_skills
 
         # Base score from structured match
         score = int(match_ratio * 100)
@@ -338,17 +488,20 @@ class MatchingService:
         score = max(35, score)
 
         # Boost if we have multiple matches
-        if len(overlap) >= 5:
+        if n_overlap >= 5:
             score = min(100, score + 10)
 
-        if len(overlap) > 0:
-            reasons.append(f"{len(overlap)} of {len(job_skills)} skills match")
+        if n_overlap > 0:
+            reasons.append(f"{n_overlap} of {n_job_skills} skills match")
         elif keyword_matches >= 2:
             reasons.append(f"Related skills found")
 
-        # Convert missing skill slugs to labels for gaps
         gaps = []
-        for slug in list(missing)[:5]:
+        if n_overlap == n_job_skills:
+            return score, gaps
+
+        # Convert missing skill slugs to labels for gaps
+        for slug in islice(job_skills - seeker_skills, 5):
             skill = SKILLS_BY_SLUG.get(slug)
             if skill:
                 gaps.append(skill.label)
@@ -359,30 +512,33 @@ class MatchingService:
 
     @staticmethod
     def _extract_skills_from_text(text: str) -> set:
-        """Extract skill slugs from text by keyword matching."""
+        """
+        Extract skill slugs from text by keyword matching.
+
+        A skill matches when its label or its slug (with hyphens replaced)
+        appears in the text; all needles are found in a single Aho-Corasick
+        pass. Short needles must also match as whole words.
+        """
         text_lower = text.lower()
         found_skills = set()
 
-        for slug, skill in SKILLS_BY_SLUG.items():
-            # Check for skill label in text
-            if skill.label.lower() in text_lower:
-                found_skills.add(slug)
-            # Also check for slug (with hyphens replaced)
-            elif slug.replace("-", " ") in text_lower:
-                found_skills.add(slug)
+        for end, (length, pattern, slugs) in _SKILL_AUTOMATON.iter(text_lower):
+            if pattern and not pattern.match(text_lower, end - length + 1):
+                continue
+            found_skills.update(slugs)
 
         return found_skills
 
     @staticmethod
-    def _score_experience(seeker: SeekerProfile, job: Job, reasons: list) -> int:
+    def _score_experience(ctx: dict, job: Job, reasons: list) -> int:
         """Score based on experience level match."""
-        if not seeker.experience_level:
+        if not ctx["experience_level"]:
             return 50  # Neutral if no preference
 
         # Infer job level from title and description
         job_level = MatchingService._infer_job_level(job)
 
-        compatible_levels = EXPERIENCE_COMPATIBILITY.get(seeker.experience_level, [])
+        compatible_levels = EXPERIENCE_COMPATIBILITY.get(ctx["experience_level"], [])
 
         if job_level in compatible_levels:
             reasons.append(f"Experience level matches")
@@ -407,18 +563,18 @@ class MatchingService:
         return None
 
     @staticmethod
-    def _score_work_style(seeker: SeekerProfile, job_keywords: set, reasons: list) -> int:
+    def _score_work_style(ctx: dict, job_keywords: set, reasons: list) -> int:
         """Score based on work style match."""
-        if not seeker.work_style:
+        if not ctx["work_style"]:
             return 50  # Neutral if no preference
 
-        style_keywords = WORK_STYLE_KEYWORDS.get(seeker.work_style, [])
+        style_keywords = WORK_STYLE_KEYWORDS.get(ctx["work_style"])
 
         if not style_keywords:
             return 50
 
         # Count how many work style keywords appear in job
-        matches = sum(1 for kw in style_keywords if kw in job_keywords)
+        matches = len(style_keywords & job_keywords)
 
         if matches >= 5:
             reasons.append(f"Great fit for your work style")
@@ -460,18 +616,35 @@ class MatchingService:
                 .exclude(description="")
                 .select_related("organization", "category")
             )
-
-        matches = []
-        for job in jobs[:scan_limit]:
-            match_data = cls.calculate_match(seeker, job)
-            if match_data["total"] >= min_score:
-                matches.append({"job": job, **match_data})
-
-        # Sort by score descending
-        matches.sort(key=lambda x: x["total"], reverse=True)
-
-        # Return top N matches
-        return matches[:limit]
+        else:
+            # _score_impact_area reads job.category for every scanned job
+            jobs = jobs.select_related("category")
+
+        # Seeker-side state is identical for every job; derive it once
+        seeker_ctx = cls._build_seeker_ctx(seeker)
+
+        # Min-heap of the best `limit` matches so far, keyed (total, -position)
+        # so that equal scores keep scan order, as a stable sort would
+        heap = []
+        for position, job in enumerate(jobs[:scan_limit]):
+            # Once the heap is full a job must beat its worst entry to count,
+            # which lets calculate_match prune hopeless jobs early
+            min_total = min_score
+            if limit > 0 and len(heap) >= limit:
+                min_total = max(min_score, heap[0][0][0] + 1)
+            match_data = cls.calculate_match(
+                seeker, job, ctx=seeker_ctx, min_total=min_total
+            )
+            if match_data.get("pruned") or match_data["total"] < min_score:
+                continue
+            key = (match_data["total"], -position)
+            if len(heap) < limit:
+                heapq.heappush(heap, (key, {"job": job, **match_data}))
+            elif heap and key > heap[0][0]:
+                heapq.heapreplace(heap, (key, {"job": job, **match_data}))
+
+        # Return top N matches, best first
+        return [match for _, match in sorted(heap, key=lambda x: x[0], reverse=True)]
 
     @classmethod
     def cache_match(cls, seeker: SeekerProfile, job: Job) -> JobMatch:
@@ -1,8 +1,8 @@
 from django.contrib.postgres.search import SearchVector
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from jobs.models import Job, SeekerProfile
+from jobs.models import Category, Job, Organization, SeekerProfile
 
 
 @receiver(post_save, sender=Job)
@@ -13,17 +13,44 @@ def embed_job_on_save(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=Job)
-def update_job_search_vector(sender, instance, created, **kwargs):
-    """Populate full-text search vector for lexical matching."""
-    if instance.is_active and instance.search_vector is None:
-        Job.objects.filter(pk=instance.pk).update(
-            search_vector=(
-                SearchVector('title', weight='A') +
-                SearchVector('description', weight='B') +
-                SearchVector('requirements', weight='C') +
-                SearchVector('impact', weight='B')
-            )
-        )
+def update_job_search_vector(sender, instance, created, update_fields=None, **kwargs):
+    """Populate full-text search vector for lexical matching.
+
+    The vector is rebuilt whenever the indexed text changes, since listing
+    search only falls back to substring matching for jobs without one.
+    """
+    if instance.search_vector is None:
+        if not instance.is_active:
+            return
+    elif update_fields is not None and not set(Job.SEARCH_TEXT_FIELDS) & set(update_fields):
+        return
+    elif not instance.search_text_changed():
+        return
+    Job.objects.filter(pk=instance.pk).update(
+        search_vector=(
+            SearchVector('title', weight='A') +
+            SearchVector('description', weight='B') +
+            SearchVector('requirements', weight='C') +
+            SearchVector('impact', weight='B')
+        ),
+        # Stale once the text changes; MatchingService re-extracts until
+        # index_job_matching fills them again
+        search_keywords=None,
+        extracted_skill_slugs=None,
+    )
+    instance.remember_search_text()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_filtered_jobs_cache(sender, instance, **kwargs):
+    """Drop cached filtered job listings when anything they match on changes."""
+    from jobs.services.job_service import JobService
+    JobService.invalidate_filtered_jobs()
 
 
 @receiver(post_save, sender=SeekerProfile)
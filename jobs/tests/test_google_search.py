@@ -0,0 +1,34 @@
+from django.test import SimpleTestCase
+
+from ..services.importers.google_search import _classify_url
+
+
+class ClassifyUrlTest(SimpleTestCase):
+    def test_job_posting_urls(self):
+        cases = {
+            "https://boards.greenhouse.io/acme-corp/jobs/4012345?gh_src=x": (
+                "greenhouse",
+                "4012345",
+                "Acme Corp",
+            ),
+            "https://jobs.lever.co/open-ai/3f2b9c1e-aa10-4d2f/apply": (
+                "lever",
+                "3f2b9c1e-aa10-4d2f",
+                "Open Ai",
+            ),
+            "http://jobs.ashbyhq.com/anthropic/9f1e2d#top": ("ashby", "9f1e2d", "Anthropic"),
+        }
+        for url, expected in cases.items():
+            with self.subTest(url=url):
+                self.assertEqual(_classify_url(url), expected)
+
+    def test_non_posting_urls(self):
+        """Board home pages and other hosts are not job postings."""
+        for url in (
+            "https://boards.greenhouse.io/acme",
+            "https://boards.greenhouse.io/acme/jobs/",
+            "https://jobs.lever.co/acme",
+            "https://example.com/acme/jobs/1",
+        ):
+            with self.subTest(url=url):
+                self.assertIsNone(_classify_url(url))
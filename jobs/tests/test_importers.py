@@ -0,0 +1,21 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..services.importers.common import _paginate_algolia
+
+
+class PaginateAlgoliaTest(SimpleTestCase):
+    def test_yields_every_page(self):
+        pages = [[{"objectID": "a"}], [{"objectID": "b"}], [{"objectID": "c"}]]
+
+        def fetch_page(url, headers, base_request, page, result_index=0):
+            return {"hits": pages[page], "nbPages": len(pages)}
+
+        with mock.patch(
+            "jobs.services.importers.common._fetch_algolia_page", side_effect=fetch_page
+        ) as fetch:
+            yielded = list(_paginate_algolia("https://example.org", {}, {"requests": [{}]}))
+
+        self.assertEqual(yielded, pages)
+        self.assertEqual([call.args[3] for call in fetch.call_args_list], [0, 1, 2])
@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase
+
+from ..services.job_boards_service import extract_tags
+
+
+class ExtractTagsTest(SimpleTestCase):
+    def _geo_tags(self, geography):
+        return extract_tags("Board", "", geography, "")
+
+    def test_geography_codes_match_as_words(self):
+        self.assertEqual(self._geo_tags("United Kingdom (UK)"), ["UK"])
+        self.assertEqual(self._geo_tags("USA"), ["US"])
+        self.assertEqual(self._geo_tags("US-based"), ["US"])
+
+    def test_geography_codes_do_not_match_inside_words(self):
+        """"Ukraine" used to be tagged UK, "Russia" and "Australia" US."""
+        self.assertEqual(self._geo_tags("Ukraine"), [])
+        self.assertEqual(self._geo_tags("Russia"), [])
+        self.assertEqual(self._geo_tags("Australia"), ["Australia"])
+
+    def test_rules_keep_priority_order(self):
+        self.assertEqual(self._geo_tags("UK, US and international"), ["Global"])
+        self.assertEqual(
+            extract_tags("Board", "Slack newsletter", "Remote", "Remote climate tech"),
+            ["Remote", "Newsletter", "Climate"],
+        )
@@ -0,0 +1,82 @@
+from django.test import TestCase
+
+from ..models import Job, Organization
+from ..services.job_service import JobService
+
+
+class CreateJobOrganizationTest(TestCase):
+    def _job_data(self, organization_name):
+        return {
+            "title": "Data Analyst",
+            "organization_name": organization_name,
+            "organization_website": "",
+            "organization_description": "",
+            "description": "Analyse programme data.",
+            "requirements": "SQL",
+            "application_url": "https://example.org/apply",
+        }
+
+    def test_reuses_oldest_org_when_names_differ_only_in_case(self):
+        """
+        Importers create organizations by exact name, so case variants can
+        share a normalized name; posting must not raise MultipleObjectsReturned.
+        """
+        oldest = Organization.objects.create(name="Acme", slug="acme")
+        Organization.objects.create(name="acme", slug="acme-1")
+
+        job = JobService.create_job(self._job_data("  ACME "))
+
+        self.assertEqual(job.organization, oldest)
+        self.assertEqual(Organization.objects.count(), 2)
+
+    def test_creates_org_with_unique_slug_on_miss(self):
+        Organization.objects.create(name="Other", slug="new-org")
+
+        job = JobService.create_job(self._job_data("New Org"))
+
+        self.assertEqual(job.organization.name, "New Org")
+        self.assertEqual(job.organization.name_normalized, "new org")
+        self.assertEqual(job.organization.slug, "new-org-1")
+
+
+class SearchVectorRefreshTest(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(name="Acme", slug="acme")
+
+    def _create_job(self, **fields):
+        defaults = {
+            "slug": "job",
+            "organization": self.org,
+            "description": "",
+            "requirements": "",
+            "application_url": "https://example.org/apply",
+            # Skip the embedding receiver, which would load the model
+            "embedding": [0.0] * 384,
+        }
+        return Job.objects.create(**{**defaults, **fields})
+
+    def _search(self, query):
+        return list(JobService.get_filtered_jobs({"q": query}))
+
+    def test_vector_rebuilt_when_text_changes(self):
+        """A job stays searchable by its current text, not its first save."""
+        job = self._create_job(title="Job at Acme")
+        self.assertEqual(self._search("economist"), [])
+
+        job = Job.objects.get(pk=job.pk)
+        job.title = "Climate Economist"
+        job.description = "Model carbon pricing scenarios."
+        job.save()
+
+        self.assertEqual(self._search("economist"), [job])
+        self.assertEqual(self._search("carbon pricing"), [job])
+
+    def test_unchanged_text_keeps_vector(self):
+        job = self._create_job(title="Climate Economist")
+        job = Job.objects.get(pk=job.pk)
+        self.assertFalse(job.search_text_changed())
+
+        job.is_featured = True
+        job.save()
+
+        self.assertEqual(self._search("economist"), [job])
@@ -0,0 +1,105 @@
+import random
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from ..models import Category, Job, Organization, SeekerProfile
+from ..services.matching_service import IMPACT_KEYWORDS, MatchingService, WORK_STYLE_KEYWORDS
+
+User = get_user_model()
+
+# Job text is drawn from words every scoring component reacts to, so the
+# generated jobs spread across the whole score range
+VOCAB = (
+    sorted(IMPACT_KEYWORDS)
+    + sorted(WORK_STYLE_KEYWORDS["researcher"])
+    + ["Python", "SQL", "Data Analysis", "Policy", "Git", "R", "remote", "team"]
+    + ["senior", "junior", "director", "head of", "mid-level", "intern"]
+)
+
+
+class PrunedMatchesTest(TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        climate = Category.objects.create(name="Climate", slug="climate")
+        health = Category.objects.create(name="Global Health", slug="global-health")
+        org = Organization.objects.create(name="Acme", slug="acme")
+
+        user = User.objects.create_user(
+            email="seeker@example.com", password="pass123", username="seeker"
+        )
+        self.seeker = SeekerProfile.objects.create(
+            user=user,
+            impact_statement="I want to reduce emissions through climate policy research",
+            skills=["python", "sql", "data-analysis", "r"],
+            experience_level=SeekerProfile.ExperienceLevel.SENIOR,
+            work_style=SeekerProfile.WorkStyle.RESEARCHER,
+        )
+        self.seeker.impact_areas.add(climate)
+
+        def words(n):
+            return " ".join(rng.choice(VOCAB) for _ in range(rng.randint(0, n)))
+
+        for i in range(60):
+            Job.objects.create(
+                title=words(5) or "Analyst",
+                slug=f"job-{i}",
+                organization=org,
+                category=rng.choice([None, climate, health]),
+                description=words(80),
+                requirements=words(20),
+                application_url="https://example.org/apply",
+                # Skip the embedding receiver, which would load the model
+                embedding=[0.0] * 384,
+            )
+        self.jobs = Job.objects.order_by("pk")
+
+    def _unpruned_top(self, min_score, limit):
+        """Score every job in full and keep the best, ties in scan order."""
+        scored = [
+            (MatchingService.calculate_match(self.seeker, job), position, job)
+            for position, job in enumerate(self.jobs)
+        ]
+        kept = [item for item in scored if item[0]["total"] >= min_score]
+        kept.sort(key=lambda item: (-item[0]["total"], item[1]))
+        return [(job.pk, match["total"]) for match, _, job in kept[:limit]]
+
+    def test_pruned_scan_returns_same_top_matches(self):
+        """Skipping jobs that cannot make the cut must not change the result."""
+        for min_score in (0, 40, 55, 70):
+            for limit in (1, 5, 20, 100):
+                with self.subTest(min_score=min_score, limit=limit):
+                    matches = MatchingService.get_matches_for_seeker(
+                        self.seeker, jobs=self.jobs, min_score=min_score, limit=limit
+                    )
+                    self.assertEqual(
+                        [(m["job"].pk, m["total"]) for m in matches],
+                        self._unpruned_top(min_score, limit),
+                    )
+
+    def test_job_reaching_min_total_is_never_pruned(self):
+        for job in self.jobs:
+            full = MatchingService.calculate_match(self.seeker, job)
+            bounded = MatchingService.calculate_match(
+                self.seeker, job, min_total=full["total"]
+            )
+            self.assertEqual(bounded, full)
+
+
+class ExtractSkillsTest(SimpleTestCase):
+    def _extract(self, text):
+        return MatchingService._extract_skills_from_text(text)
+
+    def test_short_skills_match_as_whole_words(self):
+        self.assertEqual(
+            self._extract("We analyse data in R and SQL, tracked in Git."),
+            {"r", "sql", "git"},
+        )
+
+    def test_short_skills_do_not_match_inside_words(self):
+        """Before word boundaries, "r" matched nearly every description."""
+        self.assertEqual(
+            self._extract("Strong programming skills for our digital storage team"),
+            set(),
+        )
+        self.assertNotIn("sql", self._extract("PostgreSQL"))
@@ -93,15 +93,15 @@ class ResourcesView(TemplateView):
     template_name = "jobs/resources.html"
 
     def get_context_data(self, **kwargs):
-        from ..services.job_boards_service import get_job_boards, get_job_board_categories
+        from ..services.job_boards_service import get_job_boards_bundle
 
         context = super().get_context_data(**kwargs)
 
         # Job boards - fetched from Ethical Job Resources Board (maintained by Ted Fickes & Edward Saperia)
-        job_boards, maintainers = get_job_boards()
-        context["job_boards"] = job_boards
-        context["job_board_categories"] = get_job_board_categories(job_boards)
-        context["job_boards_maintainers"] = maintainers
+        job_boards = get_job_boards_bundle()
+        context["job_boards"] = job_boards["boards"]
+        context["job_board_categories"] = job_boards["categories"]
+        context["job_boards_maintainers"] = job_boards["maintainers"]
 
         # Communities & Networks
         context["communities"] = [